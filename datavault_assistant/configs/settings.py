@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Dict, Optional
 from pydantic_settings import BaseSettings,SettingsConfigDict
 from functools import lru_cache
 
@@ -22,6 +22,11 @@ class Settings(BaseSettings):
     # Memory Settings
     MEMORY_TYPE: str = "buffer"  # buffer, file, redis
     MEMORY_KEY: str = "chat_history"
+    # LLM response cache, defaults to ~/.cache/datavault_assistant
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_DIR: Optional[str] = None
+    # Responses kept on disk, the least recently used ones are evicted beyond this
+    LLM_CACHE_MAX_ENTRIES: int = 1000
     
     model_config = SettingsConfigDict(env_file='.env', case_sensitive=True)
     
@@ -36,7 +41,7 @@ class Settings(BaseSettings):
         """Get PostgreSQL connection URL"""
         return f"postgresql://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 @dataclass
 class ParserConfig:
     version: str = "1.0.0"
@@ -45,6 +50,26 @@ class ParserConfig:
     validation_level: str = "strict"
     target_schema: str = "integration"
     collision_code: str="mdm"
+    # Write hub/link/satellite YAML with the fixed-shape emitter instead of PyYAML
+    fast_yaml_emit: bool = False
+    # Output file format for entities and summaries: "yaml" or "json"
+    output_format: str = "yaml"
+    # Worker processes for hub/satellite parsing, 0 parses in the calling process
+    parse_workers: int = 0
+    # Leave output files untouched when their content would not change
+    skip_unchanged_writes: bool = False
+    # Write output files through raw file descriptors, for large batches
+    bulk_emit: bool = False
+    # One multi-document file per entity type (e.g. hubs.yaml) instead of one file per entity
+    combined_output: bool = False
+    # dtypes for the text columns of the mapping CSV, read as-is instead of inferred;
+    # "category" stores each repeated schema/table/type name once for large mappings
+    mapping_dtypes: Dict[str, str] = field(default_factory=lambda: {
+        "SCHEMA_NAME": "str",
+        "TABLE_NAME": "str",
+        "COLUMN_NAME": "str",
+        "DATA_TYPE": "str",
+    })
     
 @lru_cache()
 def get_settings() -> Settings:
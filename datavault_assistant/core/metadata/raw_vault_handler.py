@@ -2,6 +2,10 @@
 # core/processors/datavault_processor.py
 from typing import Dict, Any, List, Union, Optional
 import yaml
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader
 from datavault_assistant.core.utils.db_handler import DatabaseHandler
 from datavault_assistant.core.utils.log_handler import create_logger
 import logging 
@@ -42,7 +46,7 @@ class DataVaultMetadataProcessor:
     def process_metadata(self, yaml_content: str) -> int:
         """Process Data Vault metadata from YAML content"""
         logger.debug("Processing metadata from YAML content")
-        data = yaml.safe_load(yaml_content)
+        data = yaml.load(yaml_content, Loader=YamlLoader)
         entity_type = data['target_entity_type'].lower()
         logger.debug(f"Entity type: {entity_type}")
         
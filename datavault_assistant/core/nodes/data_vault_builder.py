@@ -1,50 +1,243 @@
 from langchain_core.prompts import ChatPromptTemplate
 import pandas as pd 
-import re
 from pathlib import Path
-from langchain_groq import ChatGroq
-from pydantic import BaseModel
+from dataclasses import dataclass, field
 import logging
-from typing import List, Dict,Optional
+from typing import List, Dict,Optional, Any
 from abc import ABC, abstractmethod
-import json
-
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('datavault_analyzer.log'),
-        logging.StreamHandler()
-    ]
+from functools import lru_cache
+from collections import OrderedDict
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import csv
+import io
+from datavault_assistant.core.utils import json_handler
+from datavault_assistant.core.utils.log_handler import init_logging
+from datavault_assistant.core.utils.cache_handler import cached_llm_call, get_cached_batch, store_cached_batch
+from datavault_assistant.core.prompt.datavault_analyze_template import (
+    hub_lnk_analyze_prompt_template,
+    sat_analyze_prompt_template
 )
+
 logger = logging.getLogger(__name__)
 
-class AnalyzerState(BaseModel):
-    metadata_content: str
-    hub_analysis: str
-    sat_analysis: str
-    final_analysis: str
+# Bump when a prompt template changes so cached LLM responses are not reused
+HUB_PROMPT_VERSION = "1"
+SAT_PROMPT_VERSION = "1"
+# Concurrent LLM requests per batch call
+DEFAULT_MAX_CONCURRENCY = 8
+
+def _extract_json_block(text: str) -> str:
+    """Return the body of the first ```json (or plain ```) fenced block in an LLM response"""
+    start = text.find("```json")
+    if start == -1:
+        start = text.find("```")
+    if start == -1:
+        raise ValueError("No fenced JSON block found in LLM response")
+    body_start = text.find("\n", start) + 1
+    end = text.find("```", body_start) if body_start else -1
+    if end == -1:
+        raise ValueError("Unterminated fenced JSON block in LLM response")
+    return text[body_start:end].rstrip("\n")
+
+def _stream_json_block(chain, inputs: Dict[str, Any]) -> str:
+    """Stream an LLM response and stop reading as soon as its ```json block is closed
+
+    Picks the same block as _extract_json_block: a plain ``` fence is only used
+    when the whole response has no ```json fence.
+    """
+    text = ""
+    body_start = -1
+    scan_from = 0
+    for chunk in chain.stream(inputs):
+        text += chunk.content
+        if body_start == -1:
+            start = text.find("```json")
+            newline = text.find("\n", start) if start != -1 else -1
+            if newline == -1:
+                continue
+            body_start = scan_from = newline + 1
+        # A fence may be split across chunks, so rescan the last two characters
+        end = text.find("```", max(body_start, scan_from - 2))
+        if end != -1:
+            # Leaving the loop closes the stream, skipping any trailing commentary
+            return text[body_start:end].rstrip("\n")
+        scan_from = len(text)
+    return _extract_json_block(text)
+
+def compact_metadata(df: pd.DataFrame) -> str:
+    """Render metadata as one tab-separated line per column for the LLM prompt"""
+    # to_string pads every cell to the widest value of its column, which inflates
+    # prompt tokens on wide descriptions; TSV keeps exactly the same fields
+    return df.fillna('').to_csv(sep='\t', index=False, lineterminator='\n').rstrip('\n')
+
+def split_metadata(metadata: str, chunk_tables: int = 8) -> List[str]:
+    """Split compact metadata into chunks of at most chunk_tables source tables, each with the header"""
+    rows = list(csv.reader(io.StringIO(metadata), delimiter='\t'))
+    if not rows or 'TABLE_NAME' not in rows[0]:
+        return [metadata]
+    header, table_idx = rows[0], rows[0].index('TABLE_NAME')
+    tables: Dict[str, List[List[str]]] = {}
+    for row in rows[1:]:
+        tables.setdefault(row[table_idx] if len(row) > table_idx else '', []).append(row)
+    if len(tables) <= chunk_tables:
+        return [metadata]
+    groups = list(tables.values())
+    chunks = []
+    for i in range(0, len(groups), chunk_tables):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, delimiter='\t', lineterminator='\n')
+        writer.writerow(header)
+        for group in groups[i:i + chunk_tables]:
+            writer.writerows(group)
+        chunks.append(buffer.getvalue().rstrip('\n'))
+    return chunks
+
+def _merge_analyses(analyses: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Merge per-chunk analyses, combining entities with the same name and unioning their list fields"""
+    merged: Dict[str, Any] = {}
+    for analysis in analyses:
+        for section, entities in analysis.items():
+            if not isinstance(entities, list):
+                merged.setdefault(section, entities)
+                continue
+            by_name = merged.setdefault(section, {})
+            for entity in entities:
+                current = by_name.get(entity.get("name"))
+                if current is None:
+                    by_name[entity.get("name")] = dict(entity)
+                    continue
+                for key, value in entity.items():
+                    if isinstance(value, list) and isinstance(current.get(key), list):
+                        current[key] = current[key] + [v for v in value if v not in current[key]]
+                    else:
+                        current.setdefault(key, value)
+    return {
+        section: list(value.values()) if isinstance(value, dict) else value
+        for section, value in merged.items()
+    }
+
+def _batch_json_blocks(outputs: List[Any]) -> List[Optional[str]]:
+    """Extract the JSON block of each chain.batch output, failed items become None"""
+    blocks = []
+    for output in outputs:
+        try:
+            if isinstance(output, Exception):
+                raise output
+            blocks.append(_extract_json_block(output.content))
+        except Exception as e:
+            logger.error("Error analyzing metadata: %s", e)
+            blocks.append(None)
+    return blocks
+
+def _cached_batch_request(analyzer, prompt_version: str, inputs: List[Dict[str, str]]):
+    """Cached responses and keys of a batch plus the positions that still need an LLM call"""
+    # Input dicts follow the analyze() argument order, so batch and single calls share cache entries
+    results, keys = get_cached_batch(analyzer, prompt_version, [tuple(item.values()) for item in inputs])
+    return results, keys, [i for i, result in enumerate(results) if result is None]
+
+def _fill_batch(results: List[Optional[str]], keys: List[Optional[str]], missing: List[int], outputs: List[Any]) -> List[Optional[str]]:
+    for index, block in zip(missing, _batch_json_blocks(outputs)):
+        results[index] = block
+    store_cached_batch([keys[i] for i in missing], [results[i] for i in missing])
+    return results
+
+def _cached_batch(analyzer, prompt_version: str, inputs: List[Dict[str, str]], max_concurrency: int) -> List[Optional[str]]:
+    """chain.batch over the inputs not in the LLM cache, None for the ones that failed"""
+    results, keys, missing = _cached_batch_request(analyzer, prompt_version, inputs)
+    if not missing:
+        return results
+    outputs = analyzer.chain.batch([inputs[i] for i in missing],
+                                   config={"max_concurrency": max_concurrency}, return_exceptions=True)
+    return _fill_batch(results, keys, missing, outputs)
+
+async def _acached_batch(analyzer, prompt_version: str, inputs: List[Dict[str, str]], max_concurrency: int) -> List[Optional[str]]:
+    """Async variant of _cached_batch, cache lookups and writes run in a worker thread"""
+    results, keys, missing = await asyncio.to_thread(_cached_batch_request, analyzer, prompt_version, inputs)
+    if not missing:
+        return results
+    outputs = await analyzer.chain.abatch([inputs[i] for i in missing],
+                                          config={"max_concurrency": max_concurrency}, return_exceptions=True)
+    return await asyncio.to_thread(_fill_batch, results, keys, missing, outputs)
+
+def _combine_analyses(hub_analysis: str, sat_analysis: str) -> Dict[str, Any]:
+    """Parse hub and satellite analyses once and merge them into one dict"""
+    final_analysis = json_handler.loads(hub_analysis)
+    final_analysis.update(json_handler.loads(sat_analysis))
+    return final_analysis
+
+def _run_coroutine(coro):
+    """Run a coroutine to completion, also when called from inside a running event loop"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    # e.g. sync analyze() called from a FastAPI handler: run on a private loop in a worker thread
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+# Prompt | llm chains reused across analyzer instances; the llm is kept in the entry so its id cannot be recycled
+_CHAIN_CACHE_SIZE = 16
+_chain_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+_chain_lock = threading.Lock()
+
+def _build_chain(prompt: ChatPromptTemplate, llm):
+    """Return the cached prompt | llm chain for this prompt and llm instance, building it on first use"""
+    key = (id(prompt), id(llm))
+    with _chain_lock:
+        cached = _chain_cache.get(key)
+        if cached is not None and cached[0] is llm:
+            _chain_cache.move_to_end(key)
+            return cached[1]
+        chain = prompt | llm
+        _chain_cache[key] = (llm, chain)
+        if len(_chain_cache) > _CHAIN_CACHE_SIZE:
+            _chain_cache.popitem(last=False)
+        return chain
+
+@lru_cache(maxsize=32)
+def _read_metadata_text(path: str, mtime_ns: int) -> str:
+    """Read a metadata CSV as compact prompt text, cached per file path and modification time"""
+    return compact_metadata(pd.read_csv(path, dtype=str))
+
+@dataclass
+class AnalyzerState:
+    metadata_content: Optional[str] = None
+    hub_analysis: Optional[str] = None
+    sat_analysis: Optional[str] = None
+    final_analysis: Optional[Dict[str, Any]] = None
+    warnings: List[str] = field(default_factory=list)
 
 class DataVaultAnalyzer:
-    def __init__(self,llm,metadata_content:Optional[str]=None):
+    def __init__(self,llm,metadata_content:Optional[str]=None,chunk_tables:Optional[int]=None):
         self.llm = llm
-        self.state=AnalyzerState
+        # Opt-in: analyze groups of at most chunk_tables source tables separately and merge them.
+        # Links between hubs of different chunks cannot be found, so None keeps one call for everything
+        self.chunk_tables = chunk_tables
+        self.state=AnalyzerState(metadata_content=metadata_content)
+        self.warnings = self.state.warnings
         self.hub_analyzer=HubAnalyzer(llm)
         self.sat_analyzer=SatelliteAnalyzer(llm)
-        self.state.metadata_content = metadata_content
         
     def get_metadata(self,path:Path):
-        df = pd.read_csv(path)
-        metadata_content = df.to_string(index=False)
+        path = Path(path)
+        metadata_content = _read_metadata_text(str(path), path.stat().st_mtime_ns)
         self.state.metadata_content=metadata_content
         return metadata_content
         
     def analyze(self,metadata_content):
         self.state.metadata_content=metadata_content
+        self.warnings.clear()
         try:
             if not self.state.metadata_content:
                 raise ValueError("No metadata loaded. Call get_metadata first.")
 
+            # With chunk_tables set, large inputs are analyzed per group of source tables concurrently, then merged
+            chunks = self._split(self.state.metadata_content)
+            if len(chunks) > 1:
+                return _run_coroutine(self._analyze_chunks(chunks))
+
             # Perform hub analysis
             self.state.hub_analysis = self.hub_analyzer.analyze(self.state.metadata_content)
             
@@ -53,134 +246,209 @@ class DataVaultAnalyzer:
                 metadata=self.state.metadata_content,
                 hub_analysis=self.state.hub_analysis
             )
-            tmp = json.loads(self.state.hub_analysis)
-            tmp.update(json.loads(self.state.sat_analysis))
-            # Combine analyses
-            # self.state.final_analysis = json.dumps(tmp, indent=2)
-            self.state.final_analysis = tmp
+            # Combine analyses: parse each result once and merge as a dict,
+            # serialization is left to the caller
+            self.state.final_analysis = _combine_analyses(self.state.hub_analysis, self.state.sat_analysis)
             return self.state.final_analysis
         except Exception as e:
-            logger.error(f"Analysis failed: {str(e)}")
+            logger.error("Analysis failed: %s", e)
             raise e
-        # self.state.hub_analysis=self.hub_analyzer.analyze(self.state.metadata_content)
-        # self.state.sat_analysis=self.sat_analyzer.analyze(metadata=self.state.metadata_content,hub_analysis=self.state.hub_analysis)
-        # self.state.final_analysis = self.state.hub_analysis + self.state.sat_analysis
-        # return self.state.final_analysis
     
+    async def aanalyze(self, metadata_content: str) -> Dict[str, Any]:
+        """Async variant of analyze, awaiting the LLM calls instead of blocking on them"""
+        self.state.metadata_content=metadata_content
+        self.warnings.clear()
+        try:
+            if not self.state.metadata_content:
+                raise ValueError("No metadata loaded. Call get_metadata first.")
+
+            chunks = self._split(self.state.metadata_content)
+            if len(chunks) > 1:
+                return await self._analyze_chunks(chunks)
+
+            self.state.hub_analysis = await self.hub_analyzer.aanalyze(self.state.metadata_content)
+            self.state.sat_analysis = await self.sat_analyzer.aanalyze(
+                self.state.metadata_content, self.state.hub_analysis
+            )
+            self.state.final_analysis = _combine_analyses(self.state.hub_analysis, self.state.sat_analysis)
+            return self.state.final_analysis
+        except Exception as e:
+            logger.error("Analysis failed: %s", e)
+            raise e
+
+    def _split(self, metadata: str) -> List[str]:
+        if not self.chunk_tables:
+            return [metadata]
+        return split_metadata(metadata, self.chunk_tables)
+
+    async def _analyze_chunks(self, chunks: List[str]) -> Dict[str, Any]:
+        logger.info("Analyzing metadata in %d chunks", len(chunks))
+
+        async def analyze_chunk(chunk: str):
+            hub_analysis = await self.hub_analyzer.aanalyze(chunk)
+            # Satellites are scoped to the hubs and links found in the same chunk
+            sat_analysis = await self.sat_analyzer.aanalyze(chunk, hub_analysis)
+            return json_handler.loads(hub_analysis), json_handler.loads(sat_analysis)
+
+        results = []
+        outcomes = await asyncio.gather(*(analyze_chunk(chunk) for chunk in chunks), return_exceptions=True)
+        for index, outcome in enumerate(outcomes, 1):
+            if isinstance(outcome, Exception):
+                # Keep the chunks that succeeded and report the failed one
+                self.warnings.append(f"Metadata chunk {index}/{len(chunks)} could not be analyzed: {outcome}")
+                continue
+            results.append(outcome)
+        if not results:
+            raise ValueError("All metadata chunks failed to analyze")
+        hub_analysis = _merge_analyses([hub for hub, _ in results])
+        sat_analysis = _merge_analyses([sat for _, sat in results])
+        self.state.hub_analysis = json_handler.dumps(hub_analysis)
+        self.state.sat_analysis = json_handler.dumps(sat_analysis)
+        final_analysis = dict(hub_analysis)
+        final_analysis.update(sat_analysis)
+        self.state.final_analysis = final_analysis
+        return self.state.final_analysis
+
+    def analyze_many(self, metadatas: List[str],
+                     max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> List[Optional[Dict[str, Any]]]:
+        """Analyze several metadata payloads with batched LLM calls, None for the ones that failed
+
+        Uses the same LLM cache entries as analyze(); each payload is sent in one call (no chunking)
+        and failures are reported in self.warnings.
+        """
+        self.warnings.clear()
+        hub_analyses = self.hub_analyzer.analyze_many(metadatas, max_concurrency)
+        pending = [i for i, hub_analysis in enumerate(hub_analyses) if hub_analysis is not None]
+        sat_analyses = self.sat_analyzer.analyze_many(
+            [metadatas[i] for i in pending], [hub_analyses[i] for i in pending], max_concurrency
+        )
+        return self._combine_many(hub_analyses, dict(zip(pending, sat_analyses)))
+
+    async def aanalyze_many(self, metadatas: List[str],
+                            max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> List[Optional[Dict[str, Any]]]:
+        """Async variant of analyze_many"""
+        self.warnings.clear()
+        hub_analyses = await self.hub_analyzer.aanalyze_many(metadatas, max_concurrency)
+        pending = [i for i, hub_analysis in enumerate(hub_analyses) if hub_analysis is not None]
+        sat_analyses = await self.sat_analyzer.aanalyze_many(
+            [metadatas[i] for i in pending], [hub_analyses[i] for i in pending], max_concurrency
+        )
+        return self._combine_many(hub_analyses, dict(zip(pending, sat_analyses)))
+
+    def _combine_many(self, hub_analyses: List[Optional[str]],
+                      sat_analyses: Dict[int, Optional[str]]) -> List[Optional[Dict[str, Any]]]:
+        results = []
+        for index, hub_analysis in enumerate(hub_analyses):
+            sat_analysis = sat_analyses.get(index)
+            try:
+                if hub_analysis is None or sat_analysis is None:
+                    raise ValueError("no JSON analysis returned by the LLM")
+                results.append(_combine_analyses(hub_analysis, sat_analysis))
+            except Exception as e:
+                self.warnings.append(f"Metadata {index + 1}/{len(hub_analyses)} could not be analyzed: {e}")
+                results.append(None)
+        return results
+
     def get_result(self):
         return self.state.final_analysis
     
 class HubAnalyzer:
+    # Built once per process: the system message is byte-identical across calls,
+    # which also lets providers with prefix caching reuse it
+    prompt = ChatPromptTemplate.from_messages([
+        ("system", hub_lnk_analyze_prompt_template.strip()),
+        ("human", "Table Metadata: {metadata}")
+    ])
+
     def __init__(self,llm):
         self.llm = llm
+        self.chain = _build_chain(self.prompt, self.llm)
 
+    @cached_llm_call(HUB_PROMPT_VERSION)
     def analyze(self,metadata:str):
-        system_template = """
-    You are a Data Vault 2.0 modeling expert in banking domain.
-    Analyze the table metadata given by user and recommend appropriate HUB and LINK components.
-                
-    Here are some requirements:
-    A Hub component represent an unique business object, and a Link component represent a relationship between Hubs.
-    A component can be derived from multiple source tables.
-    A Link component must include at least 2 existed Hub components in relationships.
-    Do NOT assume that a table is a Hub or Link component if it does not meet the requirements.
-
-    Think step by step and response the final result with the following JSON format in a markdown cell:
-    {{
-        "hubs": [
-            {{
-                "name": Hub component name, it should be in the format of HUB_<business_object_name>,
-                "business_keys": List of business key columns,
-                "source_tables": List of source tables,
-                "description": Short description of the component
-            }}
-        ],
-        "links": [
-            {{
-                "name": Link component name, it should be in the format of LNK_<relationship_name>,
-                "related_hubs": List of related hubs,
-                "business_keys": List of business key columns, including all bussiness keys from related hubs,
-                "source_tables": List of source tables,
-                "description": Short description of the component
-            }}
-        ]
-    }}
-    """.strip()
-        chain = (ChatPromptTemplate.from_messages([
-                ("system", system_template),
-                ("human", "Table Metadata: {metadata}")
-            ])
-            | self.llm 
-        )
         try:
-            analysis = chain.invoke({"metadata": metadata})
-            analysis = re.search(r"```(json)?\n(.*)\n```", analysis.content, re.DOTALL).group(2)
-            # analysis = 
+            # Hub output gates the satellite call, so return as soon as the JSON block is complete
+            analysis = _stream_json_block(self.chain, {"metadata": metadata})
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Hub/Link analysis content: %s", analysis)
             return analysis
         except Exception as e:
-            print(f"Error analyzing metadata: {str(e)}")
+            logger.error("Error analyzing metadata: %s", e)
+
+    @cached_llm_call(HUB_PROMPT_VERSION)
+    async def aanalyze(self,metadata:str):
+        try:
+            analysis = await self.chain.ainvoke({"metadata": metadata})
+            return _extract_json_block(analysis.content)
+        except Exception as e:
+            logger.error("Error analyzing metadata: %s", e)
+
+    def analyze_many(self, metadatas: List[str], max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> List[Optional[str]]:
+        """Batched analyze() sharing its cache, None for the payloads that failed"""
+        return _cached_batch(self, HUB_PROMPT_VERSION, [{"metadata": m} for m in metadatas], max_concurrency)
+
+    async def aanalyze_many(self, metadatas: List[str], max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> List[Optional[str]]:
+        """Async variant of analyze_many"""
+        return await _acached_batch(self, HUB_PROMPT_VERSION, [{"metadata": m} for m in metadatas], max_concurrency)
             
 class SatelliteAnalyzer:
+    prompt = ChatPromptTemplate.from_messages([
+        ("system", sat_analyze_prompt_template.strip()),
+        ("human", "Table Metadata: {metadata}\nHUB and LINK Analysis: {hub_analysis}")
+    ])
+
     def __init__(self,llm):
         self.llm = llm
+        self.chain = _build_chain(self.prompt, self.llm)
         
+    @cached_llm_call(SAT_PROMPT_VERSION)
     def analyze(self,metadata:str,hub_analysis:str):
-        system_template = """
-    You are a Data Vault 2.0 modeling expert in banking domain.
-    Analyze the table metadata and an analysis of HUB and LINK components given by user \
-    and recommend appropriate SATELLITE components.
-
-    Here are some requirements:
-    A Satellite component contains descriptive attributes for HUBs or LINKs, but not include business keys.
-    A Satellite component should be navigated from a HUB or LINK component.
-    Each column in the source table must not be duplicated in multiple components, and no column should be left out.
-
-    Think step by step and response the final result with the following JSON format in a markdown cell:
-    {{
-        "satellites": [
-            {{
-                "name": Satellite component name, it should be in the format of SAT_<business_object_name>_<description>,
-                "hub": Related Hub component name,
-                "business_keys": List of business key columns from related Hub component,
-                "source_table": Source table name,
-                "descriptive_attrs": List of descriptive attributes
-            }}
-        ],
-        "link_satellites": [
-            {{
-                "name": Satellite component name, it should be in the format of LSAT_<relationship_name>_<description>,
-                "link": Related Link component name,
-                "business_keys": List of business key columns from related Link component,
-                "source_table": Source table name,
-                "descriptive_attrs": List of descriptive attributes
-            }}
-    }}
-    """.strip()
-
-        chain = (
-            ChatPromptTemplate.from_messages([
-                ("system", system_template),
-                ("human", "Table Metadata: {metadata}\nHUB and LINK Analysis: {hub_analysis}")
-            ])
-            | self.llm
-        )
-
         try:
-            analysis = chain.invoke({"metadata": metadata, "hub_analysis": hub_analysis})
-            analysis = re.search(r"```(json)?\n(.*)\n```", analysis.content, re.DOTALL).group(2)
+            analysis = self.chain.invoke({"metadata": metadata, "hub_analysis": hub_analysis})
+            analysis = _extract_json_block(analysis.content)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Satellite analysis content: %s", analysis)
             return analysis
         except Exception as e:
-            print(f"Error analyzing metadata: {str(e)}")
-            # return state
+            logger.error("Error analyzing metadata: %s", e)
+
+    @cached_llm_call(SAT_PROMPT_VERSION)
+    async def aanalyze(self,metadata:str,hub_analysis:str):
+        try:
+            analysis = await self.chain.ainvoke({"metadata": metadata, "hub_analysis": hub_analysis})
+            return _extract_json_block(analysis.content)
+        except Exception as e:
+            logger.error("Error analyzing metadata: %s", e)
+
+    def analyze_many(self, metadatas: List[str], hub_analyses: List[str],
+                     max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> List[Optional[str]]:
+        """Batched analyze() sharing its cache, None for the payloads that failed"""
+        inputs = [{"metadata": m, "hub_analysis": h} for m, h in zip(metadatas, hub_analyses)]
+        return _cached_batch(self, SAT_PROMPT_VERSION, inputs, max_concurrency)
+
+    async def aanalyze_many(self, metadatas: List[str], hub_analyses: List[str],
+                            max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> List[Optional[str]]:
+        """Async variant of analyze_many"""
+        inputs = [{"metadata": m, "hub_analysis": h} for m, h in zip(metadatas, hub_analyses)]
+        return await _acached_batch(self, SAT_PROMPT_VERSION, inputs, max_concurrency)
         
+async def aanalyze_many(metadatas: List[str], llm, concurrency: int = DEFAULT_MAX_CONCURRENCY) -> List[Optional[Dict[str, Any]]]:
+    """Shortcut for DataVaultAnalyzer(llm).aanalyze_many: at most `concurrency` calls in flight, None for failed payloads"""
+    return await DataVaultAnalyzer(llm).aanalyze_many(metadatas, concurrency)
+
 if __name__ == "__main__":
+    import os
+    import sys
+    from langchain_groq import ChatGroq
+    init_logging()
     llm = ChatGroq( 
                 model="llama-3.3-70b-versatile" ,
                 temperature=0,
             )
             
-    metadata=pd.read_csv(r"D:\01_work\08_dev\ai_datavault\datavault_assistant\datavault_assistant\data\metadata_src.csv")
-    metadata=metadata.to_string(index=False)
     analyzer = DataVaultAnalyzer(llm)
+    metadata=analyzer.get_metadata(r"D:\01_work\08_dev\ai_datavault\datavault_assistant\datavault_assistant\data\metadata_src.csv")
     result=analyzer.analyze(metadata)
-    print(result)
\ No newline at end of file
+    # Dumping the whole analysis to the terminal is opt-in
+    if os.environ.get('DV_VERBOSE'):
+        sys.stdout.buffer.write(json_handler.dumpb(result, indent=True) + b"\n")
\ No newline at end of file
@@ -1,37 +1,157 @@
 from fastapi import HTTPException
 from fastapi.responses import FileResponse
 from pathlib import Path
-from typing import Dict, Any, List, Optional,Union
+from typing import Dict, Any, List, NamedTuple, Optional, Set, Tuple, Union
 from datetime import datetime
 import pandas as pd 
 import logging
 import yaml
+try:
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as YamlDumper
 import json
 import tempfile
 import shutil
 import zipfile
 import io
+import re
+import os
+from functools import partial
+from collections import Counter
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datavault_assistant.configs.settings import ParserConfig
+from datavault_assistant.core.utils import json_handler
 from datavault_assistant.core.nodes.hub_parser import HubParser
 from datavault_assistant.core.nodes.link_parser import LinkParser
 from datavault_assistant.core.nodes.sat_parser import SatelliteParser
 from datavault_assistant.core.nodes.lsat_parser import LinkSatelliteParser
 
+YAML_WRITE_BUFFER = 64 * 1024
+# yaml.dump bound to the C dumper and the output defaults once, not per file
+_yaml_dump = partial(yaml.dump, Dumper=YamlDumper, allow_unicode=True, sort_keys=False)
+_yaml_dump_all = partial(yaml.dump_all, Dumper=YamlDumper, allow_unicode=True, sort_keys=False)
+# Entity types whose fixed-shape output can skip the PyYAML emitter when fast_emit is on
+FAST_EMIT_ENTITY_TYPES = frozenset({"hub", "lnk", "sat", "lsat"})
+# File extension per supported output format
+OUTPUT_EXTENSIONS = {"yaml": ".yaml", "json": ".json"}
+_PLAIN_YAML_KEY = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+# Characters json.dumps leaves raw that YAML rejects (DEL, C1 controls, surrogates, U+FFFE/U+FFFF)
+# or reads back as line breaks (NEL, U+2028/U+2029)
+_UNSAFE_YAML_CHARS = re.compile("[\x7f-\x9f\u2028\u2029\ud800-\udfff\ufffe\uffff]")
+
+def _yaml_quoted(text: str) -> str:
+    """JSON double-quoted form of text, TypeError when YAML would not read it back unchanged"""
+    if _UNSAFE_YAML_CHARS.search(text):
+        raise TypeError("String contains characters outside the YAML printable set")
+    return json.dumps(text, ensure_ascii=False)
+
+def _yaml_key(key: Any) -> str:
+    if not isinstance(key, str):
+        raise TypeError(f"Unsupported YAML key type: {type(key).__name__}")
+    return key if _PLAIN_YAML_KEY.fullmatch(key) and key not in ("null", "true", "false") else _yaml_quoted(key)
+
+def _yaml_scalar(value: Any) -> str:
+    """Render a plain scalar as YAML; strings use JSON double-quoted form, which YAML accepts as-is"""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, str):
+        return _yaml_quoted(value)
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        if value != value:
+            return ".nan"
+        if value in (float("inf"), float("-inf")):
+            return ".inf" if value > 0 else "-.inf"
+        text = repr(value)
+        # YAML 1.1 only reads exponents with a dot as floats, e.g. 1.0e-05 rather than 1e-05
+        if "e" in text and "." not in text:
+            text = text.replace("e", ".0e", 1)
+        return text
+    raise TypeError(f"Unsupported YAML scalar type: {type(value).__name__}")
+
+def _emit_yaml_block(value: Any, indent: int, lines: List[str]) -> None:
+    """Append block-style YAML lines for a nested dict/list, PyYAML's default layout"""
+    pad = " " * indent
+    if isinstance(value, dict):
+        for key, item in value.items():
+            key = _yaml_key(key)
+            if isinstance(item, (dict, list)) and item:
+                lines.append(f"{pad}{key}:")
+                # Lists stay at the key's indentation, mappings are nested two spaces deeper
+                _emit_yaml_block(item, indent if isinstance(item, list) else indent + 2, lines)
+            else:
+                lines.append(f"{pad}{key}: {_yaml_inline(item)}")
+    else:
+        for item in value:
+            if isinstance(item, (dict, list)) and item:
+                nested: List[str] = []
+                _emit_yaml_block(item, indent + 2, nested)
+                lines.append(f"{pad}- {nested[0][indent + 2:]}")
+                lines.extend(nested[1:])
+            else:
+                lines.append(f"{pad}- {_yaml_inline(item)}")
+
+def _yaml_inline(value: Any) -> str:
+    if isinstance(value, dict):
+        return "{}"
+    if isinstance(value, list):
+        return "[]"
+    return _yaml_scalar(value)
+
+def render_fast_yaml(data: Dict[str, Any]) -> str:
+    """Render a hub/link/satellite metadata document without going through the generic PyYAML emitter"""
+    lines: List[str] = []
+    _emit_yaml_block(data, 0, lines)
+    return "\n".join(lines) + "\n"
+
+def _write_fd(output_path: Union[str, Path], payload: bytes) -> None:
+    """Write payload with os.open/os.write, then hint the kernel that the pages will not be read back"""
+    fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, len(payload), os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
 class FileProcessor:
     """Class xử lý file I/O operations"""
     
     def __init__(self, 
                  output_dir: Optional[Path] = None, 
-                 encoding: str = 'utf-8'):
+                 encoding: str = 'utf-8',
+                 fast_emit: bool = False,
+                 output_format: str = "yaml",
+                 skip_unchanged: bool = False,
+                 bulk_emit: bool = False):
         """
         Initialize FileProcessor
         
         Args:
             output_dir: Optional directory path for output files
             encoding: File encoding (default: utf-8)
+            fast_emit: Render hub/link/satellite documents with the fixed-shape emitter (default: False)
+            output_format: "yaml" or "json" for _save_structured (default: yaml)
+            skip_unchanged: Leave files whose content is already identical untouched (default: False)
+            bulk_emit: Write through a raw file descriptor, bypassing the Python file object (default: False)
         """
+        if output_format not in OUTPUT_EXTENSIONS:
+            raise ValueError(f"Unsupported output format: {output_format}")
         self.output_dir = output_dir
         self.encoding = encoding
+        self.fast_emit = fast_emit
+        self.output_format = output_format
+        self.output_extension = OUTPUT_EXTENSIONS[output_format]
+        self.skip_unchanged = skip_unchanged
+        self.bulk_emit = bulk_emit
+        # Directories already created by this processor, so each one costs a single mkdir
+        self._ensured_dirs: Set[str] = set()
         self.logger = logging.getLogger(self.__class__.__name__)
 
     def _read_json(self, file_path: Union[str, Path]) -> Dict[str, Any]:
@@ -53,15 +173,17 @@ class FileProcessor:
             if not file_path.exists():
                 raise FileNotFoundError(f"File không tồn tại: {file_path}")
                 
-            with open(file_path, 'r', encoding=self.encoding) as f:
-                return json.load(f)
+            # orjson (when installed) parses UTF-8 bytes directly, other encodings are decoded first
+            if self.encoding.lower().replace('-', '') == 'utf8':
+                return json_handler.loads(file_path.read_bytes())
+            return json_handler.loads(file_path.read_text(encoding=self.encoding))
                 
-        except json.JSONDecodeError as e:
-            self.logger.error(f"Lỗi parse JSON từ {file_path}: {str(e)}")
+        except json_handler.JSONDecodeError as e:
+            self.logger.error("Lỗi parse JSON từ %s: %s", file_path, e)
             raise ValueError(f"Lỗi parse JSON: {str(e)}")
             
         except Exception as e:
-            self.logger.error(f"Unexpected error reading {file_path}: {str(e)}")
+            self.logger.error("Unexpected error reading %s: %s", file_path, e)
             raise
 
     def _read_csv(self, file_path: Union[str, Path], **kwargs) -> pd.DataFrame:
@@ -86,14 +208,15 @@ class FileProcessor:
             return pd.read_csv(file_path, **kwargs)
             
         except Exception as e:
-            self.logger.error(f"Error reading CSV {file_path}: {str(e)}")
+            self.logger.error("Error reading CSV %s: %s", file_path, e)
             raise
 
     def _save_yaml(self, 
                  data: Dict[str, Any], 
                  output_path: Union[str, Path],
                  allow_unicode: bool = True,
-                 sort_keys: bool = False) -> None:
+                 sort_keys: bool = False,
+                 ensure_dir: bool = True) -> None:
         """
         Save data to YAML file
         
@@ -102,22 +225,111 @@ class FileProcessor:
             output_path: Output file path
             allow_unicode: Allow unicode in output (default: True)  
             sort_keys: Sort dictionary keys (default: False)
+            ensure_dir: Create the parent directory first (default: True)
         """
         
         try:
-            output_path = Path(output_path)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(output_path, 'w', encoding=self.encoding) as f:
-                yaml.dump(data, 
-                         f,
-                         allow_unicode=allow_unicode,
-                         sort_keys=sort_keys)
-                
-            self.logger.info(f"Successfully saved YAML to: {output_path}")
+            if ensure_dir:
+                self._ensure_dir(os.path.dirname(output_path))
+            
+            # Render in memory, then write the file in one buffered call
+            content = None
+            if self.fast_emit and not sort_keys and data.get("target_entity_type") in FAST_EMIT_ENTITY_TYPES:
+                try:
+                    content = render_fast_yaml(data)
+                except TypeError:
+                    content = None
+            if content is None:
+                content = _yaml_dump(data, allow_unicode=allow_unicode, sort_keys=sort_keys)
+            if self._write_bytes(output_path, content.encode(self.encoding)):
+                self.logger.info("Successfully saved YAML to: %s", output_path)
             
         except Exception as e:
-            self.logger.error(f"Error saving YAML to {output_path}: {str(e)}")
+            self.logger.error("Error saving YAML to %s: %s", output_path, e)
+            if isinstance(e, FileNotFoundError):
+                # Directory removed since it was created: let the next save recreate it
+                self._ensured_dirs.discard(os.path.dirname(output_path) or ".")
+            raise
+
+    def _write_bytes(self, output_path: Union[str, Path], payload: bytes) -> bool:
+        """Write payload in one buffered call; False when skip_unchanged found identical content"""
+        if self.skip_unchanged and self._has_content(output_path, payload):
+            self.logger.info("Unchanged, skipped writing: %s", output_path)
+            return False
+        if self.bulk_emit:
+            _write_fd(output_path, payload)
+            return True
+        with open(output_path, 'wb', buffering=YAML_WRITE_BUFFER) as f:
+            f.write(payload)
+        return True
+
+    @staticmethod
+    def _has_content(output_path: Union[str, Path], payload: bytes) -> bool:
+        try:
+            # A size mismatch settles most changed files without reading them
+            if os.stat(output_path).st_size != len(payload):
+                return False
+            with open(output_path, 'rb') as f:
+                return f.read() == payload
+        except FileNotFoundError:
+            return False
+
+    def _save_structured(self,
+                         data: Dict[str, Any],
+                         output_path: Union[str, Path],
+                         ensure_dir: bool = True) -> None:
+        """
+        Save data in the configured output format (YAML or JSON)
+        
+        Args:
+            data: Data to save
+            output_path: Output file path
+            ensure_dir: Create the parent directory first (default: True)
+        """
+        if self.output_format == "yaml":
+            return self._save_yaml(data, output_path, ensure_dir=ensure_dir)
+        
+        try:
+            if ensure_dir:
+                self._ensure_dir(os.path.dirname(output_path))
+            
+            # JSON is serialized straight to UTF-8 bytes (orjson when installed)
+            if self._write_bytes(output_path, json_handler.dumpb(data, indent=True)):
+                self.logger.info("Successfully saved JSON to: %s", output_path)
+            
+        except Exception as e:
+            self.logger.error("Error saving JSON to %s: %s", output_path, e)
+            if isinstance(e, FileNotFoundError):
+                self._ensured_dirs.discard(os.path.dirname(output_path) or ".")
+            raise
+
+    def _save_documents(self,
+                        documents: List[Dict[str, Any]],
+                        output_path: Union[str, Path],
+                        ensure_dir: bool = True) -> None:
+        """
+        Save several documents to one file: a YAML stream, or a JSON array
+        
+        Args:
+            documents: Documents to save, in order
+            output_path: Output file path
+            ensure_dir: Create the parent directory first (default: True)
+        """
+        try:
+            if ensure_dir:
+                self._ensure_dir(os.path.dirname(output_path))
+            
+            if self.output_format == "yaml":
+                payload = _yaml_dump_all(documents).encode(self.encoding)
+            else:
+                payload = json_handler.dumpb(documents, indent=True)
+            if self._write_bytes(output_path, payload):
+                self.logger.info("Successfully saved %d documents to: %s", len(documents), output_path)
+            
+        except Exception as e:
+            self.logger.error("Error saving documents to %s: %s", output_path, e)
+            if isinstance(e, FileNotFoundError):
+                self._ensured_dirs.discard(os.path.dirname(output_path) or ".")
             raise
 
     def _save_processing_summary(self,
@@ -125,7 +337,7 @@ class FileProcessor:
                               output_dir: Path,
                               entity_type: str = "entity") -> None:
         """
-        Save processing summary to YAML file
+        Save processing summary in the configured output format
         
         Args:
             results: List of processing results
@@ -133,24 +345,33 @@ class FileProcessor:
             entity_type: Type of entity being processed
         """
         try:
+            # One pass over the results for all three counts
+            counts = Counter(r["status"] for r in results)
             summary = {
                 "processing_summary": {
                     "processed_at": datetime.now().isoformat(),
                     f"total_{entity_type}s": len(results),
-                    "successful": sum(1 for r in results if r["status"] != "error"),
-                    "warnings": sum(1 for r in results if r["status"] == "warnings"),
-                    "errors": sum(1 for r in results if r["status"] == "error"),
+                    "successful": len(results) - counts["error"],
+                    "warnings": counts["warnings"],
+                    "errors": counts["error"],
                     "details": results
                 }
             }
             
-            summary_file = Path(output_dir) / f"processing_{entity_type}_summary.yaml"
-            self.save_yaml(summary, summary_file)
+            summary_file = Path(output_dir) / f"processing_{entity_type}_summary{self.output_extension}"
+            self._save_structured(summary, summary_file)
             
         except Exception as e:
-            self.logger.error(f"Error saving processing summary: {str(e)}")
+            self.logger.error("Error saving processing summary: %s", e)
             raise
 
+    def _ensure_dir(self, directory: Union[str, Path]) -> None:
+        """Create directory (and parents) unless this processor already did"""
+        directory = os.fspath(directory) or "."
+        if directory not in self._ensured_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._ensured_dirs.add(directory)
+
     def _ensure_output_directory(self, directory: Optional[Union[str, Path]] = None) -> Path:
         """
         Ensure output directory exists
@@ -166,11 +387,11 @@ class FileProcessor:
             if not output_dir:
                 raise ValueError("No output directory specified")
                 
-            output_dir.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(output_dir)
             return output_dir
             
         except Exception as e:
-            self.logger.error(f"Error ensuring output directory: {str(e)}")
+            self.logger.error("Error ensuring output directory: %s", e)
             raise
 
     def get_output_path(self, 
@@ -200,7 +421,7 @@ class FileProcessor:
             return output_dir / filename
             
         except Exception as e:
-            self.logger.error(f"Error getting output path: {str(e)}")
+            self.logger.error("Error getting output path: %s", e)
             raise
 
 
@@ -251,7 +472,7 @@ class YAMLDownloader:
             )
             
         except Exception as e:
-            self.logger.error(f"Error creating YAML download: {str(e)}")
+            self.logger.error("Error creating YAML download: %s", e)
             raise HTTPException(
                 status_code=500,
                 detail=f"Error generating YAML file: {str(e)}"
@@ -306,7 +527,7 @@ class YAMLDownloader:
             )
             
         except Exception as e:
-            self.logger.error(f"Error creating ZIP download: {str(e)}")
+            self.logger.error("Error creating ZIP download: %s", e)
             raise HTTPException(
                 status_code=500,
                 detail=f"Error generating ZIP file: {str(e)}"
@@ -317,7 +538,7 @@ class YAMLDownloader:
         try:
             Path(path).unlink(missing_ok=True)
         except Exception as e:
-            self.logger.error(f"Error cleaning up temp file: {str(e)}")
+            self.logger.error("Error cleaning up temp file: %s", e)
 
     async def _cleanup_temp_files(self, temp_dir: Path, zip_path: str):
         """Cleanup temporary directory and ZIP file"""
@@ -325,9 +546,54 @@ class YAMLDownloader:
             shutil.rmtree(temp_dir)
             Path(zip_path).unlink(missing_ok=True)
         except Exception as e:
-            self.logger.error(f"Error cleaning up temp files: {str(e)}")
+            self.logger.error("Error cleaning up temp files: %s", e)
 
     
+# Entity parsing plus the file writes are mostly I/O bound, threads overlap the writes
+MAX_IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+try:
+    import pyarrow  # noqa: F401
+    # Multi-threaded Arrow CSV reader when pyarrow is installed
+    MAPPING_CSV_ENGINE = "pyarrow"
+except ImportError:
+    MAPPING_CSV_ENGINE = "c"
+# Mapping CSV columns read by the parsers; other columns are not loaded
+MAPPING_COLUMNS = ("SCHEMA_NAME", "TABLE_NAME", "COLUMN_NAME", "DATA_TYPE", "LENGTH", "NULLABLE", "DESCRIPTION")
+
+class EntitySpec(NamedTuple):
+    """How DataProcessor processes one entity type"""
+    section: str                # key in input_data and in the results
+    label: str                  # key of the entity name in each result entry
+    parser_attr: str            # DataProcessor attribute holding the parser
+    worker_type: Optional[str]  # parser in parse worker processes, None to always parse here
+    summary_name: str           # processing summary file name, without extension
+
+HUB_SPEC = EntitySpec("hubs", "hub", "hub_parser", "hub", "processing_hub_summary")
+LINK_SPEC = EntitySpec("links", "link", "link_parser", None, "processing_link_summary")
+SAT_SPEC = EntitySpec("satellites", "satellite", "sat_parser", "sat", "processing_sat_summary")
+LSAT_SPEC = EntitySpec("link_satellites", "link_satellite", "lsat_parser", None, "processing_lsat_summary")
+# Processing order: links after hubs, link satellites after links
+ENTITY_SPECS = (HUB_SPEC, LINK_SPEC, SAT_SPEC, LSAT_SPEC)
+
+# Parsers and mapping data of a parse worker process, set once by _init_parse_worker
+_worker_parsers: Dict[str, Any] = {}
+_worker_mapping: Optional[pd.DataFrame] = None
+
+def _init_parse_worker(config: ParserConfig, mapping_data: pd.DataFrame, batch_now: Optional[str]) -> None:
+    """Build the parsers of a worker process; the mapping data is pickled once per worker, not per entity"""
+    global _worker_mapping
+    _worker_mapping = mapping_data
+    hub_parser = HubParser(config)
+    hub_parser._batch_now = batch_now
+    sat_parser = SatelliteParser(config)
+    sat_parser._batch_now = batch_now
+    _worker_parsers["hub"] = hub_parser
+    _worker_parsers["sat"] = sat_parser
+
+def _parse_in_worker(parser_type: str, entity: Dict[str, Any]) -> Dict[str, Any]:
+    return _worker_parsers[parser_type].parse(entity, _worker_mapping)
+
 class DataProcessor:
     """Class xử lý data cho tất cả loại entities trong Data Vault"""
     
@@ -342,7 +608,33 @@ class DataProcessor:
         self.lsat_parser = LinkSatelliteParser(config)
         
         # Create file processor for saving files
-        self.file_processor = FileProcessor()  
+        self.file_processor = FileProcessor(fast_emit=config.fast_yaml_emit,
+                                            output_format=config.output_format,
+                                            skip_unchanged=config.skip_unchanged_writes,
+                                            bulk_emit=config.bulk_emit)
+        self.output_ext = self.file_processor.output_extension
+        # Thread pool for file writes, shared across calls and created on first use
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+        # Process pool for hub/satellite parsing, only alive during process_data (parse_workers > 0)
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        
+    def __enter__(self) -> "DataProcessor":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Shut down the file write pool, waiting for pending writes"""
+        if self._io_pool is not None:
+            self._io_pool.shutdown(wait=True)
+            self._io_pool = None
+    
+    def _get_io_pool(self) -> ThreadPoolExecutor:
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(max_workers=MAX_IO_WORKERS,
+                                               thread_name_prefix="dv-io")
+        return self._io_pool
         
     def process_data(self, 
                     input_data: Dict[str, Any], 
@@ -363,28 +655,29 @@ class DataProcessor:
             output_dir = Path(output_dir)
             output_dir.mkdir(parents=True, exist_ok=True)
             
-            results = {
-                "hubs": [],
-                "links": [],
-                "satellites": [],
-                "link_satellites": []
-            }
+            results = {spec.section: [] for spec in ENTITY_SPECS}
             
-            # Process hubs
-            if "hubs" in input_data:
-                results["hubs"] = self._process_hubs(input_data, mapping_data, output_dir)
+            # Build hub/link metadata indexes once for the link and link satellite validators
+            self._build_indexes(input_data)
             
-            # Process links (sau khi có hub metadata)
-            if "links" in input_data:
-                results["links"] = self._process_links(input_data, mapping_data, output_dir)
+            # One created_at for the whole batch instead of a clock read per entity
+            batch_now = datetime.now().isoformat()
+            self._set_batch_now(batch_now)
             
-            # Process satellites
-            if "satellites" in input_data:
-                results["satellites"] = self._process_satellites(input_data, mapping_data, output_dir)
-                
-            # Process link satellites (sau khi có link metadata)
-            if "link_satellites" in input_data:
-                results["link_satellites"] = self._process_link_satellites(input_data, mapping_data, output_dir)
+            # Hubs and satellites do not depend on other entities, so they can be parsed in worker processes
+            if self.config.parse_workers > 0 and any(
+                spec.worker_type and input_data.get(spec.section) for spec in ENTITY_SPECS
+            ):
+                self._parse_pool = ProcessPoolExecutor(
+                    max_workers=self.config.parse_workers,
+                    initializer=_init_parse_worker,
+                    initargs=(self.config, mapping_data, batch_now)
+                )
+            
+            # Process từng loại entity theo thứ tự của ENTITY_SPECS
+            for spec in ENTITY_SPECS:
+                if spec.section in input_data:
+                    results[spec.section] = self._process_entities(spec, input_data, mapping_data, output_dir)
             
             # Save summary for each entity type
             self._save_summaries(results, output_dir)
@@ -392,164 +685,149 @@ class DataProcessor:
             return results
             
         except Exception as e:
-            self.logger.error(f"Error processing data: {str(e)}")
+            self.logger.error("Error processing data: %s", e)
             raise
+        finally:
+            self._set_batch_now(None)
+            # The next run may bring another mapping file, so do not keep this one's lookups alive
+            for spec in ENTITY_SPECS:
+                getattr(self, spec.parser_attr).datatype_service.clear_cache()
+            if self._parse_pool is not None:
+                self._parse_pool.shutdown(wait=True)
+                self._parse_pool = None
     
+    def _set_batch_now(self, batch_now: Optional[str]) -> None:
+        """Set the shared created_at on every entity parser"""
+        for spec in ENTITY_SPECS:
+            getattr(self, spec.parser_attr)._batch_now = batch_now
+
     def process_file(self, input_file: Path, mapping_file: Path, output_dir: Path) -> Dict[str, Any]:
         """Process từ input files"""
         try:
             input_data = self.file_processor._read_json(input_file)
-            mapping_data = pd.read_csv(mapping_file)
+            mapping_data = self._read_mapping_csv(mapping_file)
             return self.process_data(input_data, mapping_data, output_dir)
         except Exception as e:
-            self.logger.error(f"Error processing from file: {str(e)}")
+            self.logger.error("Error processing from file: %s", e)
             raise
             
-    def _process_hubs(self, input_data: Dict[str, Any], mapping_data: pd.DataFrame, 
-                     output_dir: Path) -> List[Dict[str, Any]]:
-        """Process hub entities"""
-        results = []
+    def _read_mapping_csv(self, mapping_file: Path) -> pd.DataFrame:
+        """Read the parser columns of the mapping CSV, with the configured text dtypes"""
+        header = pd.read_csv(mapping_file, nrows=0).columns
+        dtypes = {col: dtype for col, dtype in self.config.mapping_dtypes.items() if col in header}
+        usecols = [col for col in header if col in MAPPING_COLUMNS]
+        return pd.read_csv(mapping_file, usecols=usecols or None, dtype=dtypes or None, engine=MAPPING_CSV_ENGINE)
         
-        for hub in input_data.get("hubs", []):
-            try:
-                self.logger.info(f"Processing hub: {hub['name']}")
-                result = self.hub_parser.parse(hub, mapping_data)
-                
-                # Save output
-                output_file = output_dir / f"{hub['name'].lower()}_metadata.yaml"
-                self.file_processor._save_yaml(result, output_file)
-                
-                results.append({
-                    "hub": hub["name"],
-                    "status": result["metadata"]["validation_status"],
-                    "warnings": result["metadata"].get("validation_warnings", [])
-                })
-                
-            except Exception as e:
-                self.logger.error(f"Error processing hub {hub.get('name')}: {str(e)}")
-                results.append({
-                    "hub": hub.get("name"),
-                    "status": "error",
-                    "error": str(e)
-                })
-                
-        return results
-        
-    def _process_links(self, input_data: Dict[str, Any], mapping_data: pd.DataFrame, 
-                      output_dir: Path) -> List[Dict[str, Any]]:
-        """Process link entities"""
-        results = []
+    def _build_indexes(self, input_data: Dict[str, Any]) -> None:
+        """Cache hub and link metadata used to validate links and link satellites"""
+        if "links" in input_data:
+            self.link_parser.hub_service.cache_hubs_metadata(input_data)
+        if "link_satellites" in input_data:
+            self.lsat_parser._cache_links_metadata(input_data)
+            
+    def _submit_parses(self, worker_type: Optional[str], entities: List[Dict[str, Any]]) -> List[Optional[Future]]:
+        """Submit entity parses to the parse pool; all None when parsing runs in this process"""
+        if self._parse_pool is None or worker_type is None:
+            return [None] * len(entities)
+        return [self._parse_pool.submit(_parse_in_worker, worker_type, entity) for entity in entities]
         
-        # Cache hub metadata
-        self.link_parser.hub_service.cache_hubs_metadata(input_data)
+    def _process_entities(self, spec: EntitySpec, input_data: Dict[str, Any],
+                          mapping_data: pd.DataFrame, output_dir: Path) -> List[Dict[str, Any]]:
+        """Parse and save every entity of one type, results in input order"""
+        entities = input_data.get(spec.section, [])
+        parser = getattr(self, spec.parser_attr)
+        # Output files are plain str paths: the directory prefix is joined once per entity type
+        output_prefix = os.path.join(output_dir, "")
+        parsed = self._submit_parses(spec.worker_type, entities)
+        if self.config.combined_output:
+            return self._process_entities_combined(spec, parser, entities, parsed, mapping_data, output_prefix)
+        # Entities of one type are independent (links and link satellites only read the metadata
+        # cached by _build_indexes), so they are parsed and written on the I/O pool
+        return list(self._get_io_pool().map(
+            lambda entity, future: self._process_entity(spec, parser, entity, mapping_data, output_prefix, future),
+            entities, parsed
+        ))
         
-        for link in input_data.get("links", []):
+    def _process_entities_combined(self, spec: EntitySpec, parser: Any, entities: List[Dict[str, Any]],
+                                   parsed: List[Optional[Future]], mapping_data: pd.DataFrame,
+                                   output_prefix: str) -> List[Dict[str, Any]]:
+        """Parse every entity of one type and save them as one multi-document file"""
+        def parse_one(entity: Dict[str, Any], future: Optional[Future]) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
             try:
-                self.logger.info(f"Processing link: {link['name']}")
-                result = self.link_parser.parse(link, mapping_data)
-                output_file = output_dir / f"{link['name'].lower()}_metadata.yaml"
-                self.file_processor._save_yaml(result, output_file)
-                
-                results.append({
-                    "link": link["name"],
-                    "status": result["metadata"]["validation_status"],
-                    "warnings": result["metadata"].get("validation_warnings", [])
-                })
-                
+                result = self._parse_entity(spec, parser, entity, mapping_data, future)
+                return self._entity_entry(spec, entity, result), result
             except Exception as e:
-                self.logger.error(f"Error processing link {link.get('name')}: {str(e)}")
-                results.append({
-                    "link": link.get("name"),
-                    "status": "error",
-                    "error": str(e)
-                })
-                
-        return results
+                return self._error_entry(spec, entity, e), None
         
-    def _process_satellites(self, input_data: Dict[str, Any], mapping_data: pd.DataFrame,
-                          output_dir: Path) -> List[Dict[str, Any]]:
-        """Process satellite entities"""
-        results = []
-        
-        for sat in input_data.get("satellites", []):
+        outcomes = list(self._get_io_pool().map(parse_one, entities, parsed))
+        documents = [result for _, result in outcomes if result is not None]
+        if documents:
+            output_file = f"{output_prefix}{spec.section}{self.output_ext}"
             try:
-                self.logger.info(f"Processing satellite: {sat['name']}")
-                result = self.sat_parser.parse(sat, mapping_data)
-                
-                output_file = output_dir / f"{sat['name'].lower()}_metadata.yaml"
-                self.file_processor._save_yaml(result, output_file)
-                
-                results.append({
-                    "satellite": sat["name"],
-                    "status": result["metadata"]["validation_status"],
-                    "warnings": result["metadata"].get("validation_warnings", [])
-                })
-                
+                self.file_processor._save_documents(documents, output_file, ensure_dir=False)
             except Exception as e:
-                self.logger.error(f"Error processing satellite {sat.get('name')}: {str(e)}")
-                results.append({
-                    "satellite": sat.get("name"),
-                    "status": "error",
-                    "error": str(e)
-                })
-                
-        return results
+                return [entry if result is None else self._error_entry(spec, entity, e)
+                        for entity, (entry, result) in zip(entities, outcomes)]
+        return [entry for entry, _ in outcomes]
         
-    def _process_link_satellites(self, input_data: Dict[str, Any], mapping_data: pd.DataFrame,
-                               output_dir: Path) -> List[Dict[str, Any]]:
-        """Process link satellite entities"""
-        results = []
-        
-        # Cache link metadata
-        self.lsat_parser._cache_links_metadata(input_data)
-        
-        for lsat in input_data.get("link_satellites", []):
-            try:
-                self.logger.info(f"Processing link satellite: {lsat['name']}")
-                result = self.lsat_parser.parse(lsat, mapping_data)
-                
-                output_file = output_dir / f"{lsat['name'].lower()}_metadata.yaml"
-                self.file_processor._save_yaml(result, output_file)
-                
-                results.append({
-                    "link_satellite": lsat["name"],
-                    "status": result["metadata"]["validation_status"],
-                    "warnings": result["metadata"].get("validation_warnings", [])
-                })
-                
-            except Exception as e:
-                self.logger.error(f"Error processing link satellite {lsat.get('name')}: {str(e)}")
-                results.append({
-                    "link_satellite": lsat.get("name"),
-                    "status": "error",
-                    "error": str(e)
-                })
-                
-        return results
+    def _process_entity(self, spec: EntitySpec, parser: Any, entity: Dict[str, Any],
+                        mapping_data: pd.DataFrame, output_prefix: str,
+                        parsed: Optional[Future] = None) -> Dict[str, Any]:
+        """Parse (or take the worker's parse result) and save a single entity"""
+        try:
+            result = self._parse_entity(spec, parser, entity, mapping_data, parsed)
+            
+            # Save output
+            output_file = f"{output_prefix}{entity['name'].lower()}_metadata{self.output_ext}"
+            self.file_processor._save_structured(result, output_file, ensure_dir=False)
+            
+            return self._entity_entry(spec, entity, result)
+            
+        except Exception as e:
+            return self._error_entry(spec, entity, e)
+    
+    def _parse_entity(self, spec: EntitySpec, parser: Any, entity: Dict[str, Any],
+                      mapping_data: pd.DataFrame, parsed: Optional[Future]) -> Dict[str, Any]:
+        self.logger.info("Processing %s: %s", spec.label.replace("_", " "), entity['name'])
+        return parsed.result() if parsed is not None else parser.parse(entity, mapping_data)
+    
+    @staticmethod
+    def _entity_entry(spec: EntitySpec, entity: Dict[str, Any], result: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            spec.label: entity["name"],
+            "status": result["metadata"]["validation_status"],
+            "warnings": result["metadata"].get("validation_warnings", [])
+        }
+    
+    def _error_entry(self, spec: EntitySpec, entity: Dict[str, Any], error: Exception) -> Dict[str, Any]:
+        self.logger.error("Error processing %s %s: %s", spec.label.replace("_", " "), entity.get('name'), error)
+        return {
+            spec.label: entity.get("name"),
+            "status": "error",
+            "error": str(error)
+        }
     
     def _save_summaries(self, results: Dict[str, List[Dict[str, Any]]], output_dir: Path) -> None:
         """Save processing summaries for all entity types"""
-        entity_types = {
-            "hubs": "processing_hub_summary.yaml",
-            "links": "processing_link_summary.yaml", 
-            "satellites": "processing_sat_summary.yaml",
-            "link_satellites": "processing_lsat_summary.yaml"
-        }
+        # All summaries of a run share one processed_at
+        processed_at = datetime.now().isoformat()
         
-        for entity_type, filename in entity_types.items():
+        for spec in ENTITY_SPECS:
+            entity_type = spec.section
             if results[entity_type]:
                 entity_results = results[entity_type]
+                counts = Counter(r["status"] for r in entity_results)
                 summary = {
                     "processing_summary": {
-                        "processed_at": datetime.now().isoformat(),
+                        "processed_at": processed_at,
                         f"total_{entity_type}": len(entity_results),
-                        "successful": sum(1 for r in entity_results if r["status"] != "error"),
-                        "warnings": sum(1 for r in entity_results if r["status"] == "warnings"),
-                        "errors": sum(1 for r in entity_results if r["status"] == "error"),
+                        "successful": len(entity_results) - counts["error"],
+                        "warnings": counts["warnings"],
+                        "errors": counts["error"],
                         "details": entity_results
                     }
                 }
                 
-                summary_file = output_dir / filename
-                self.file_processor._save_yaml(summary, summary_file)
+                summary_file = output_dir / f"{spec.summary_name}{self.output_ext}"
+                self.file_processor._save_structured(summary, summary_file, ensure_dir=False)
 
@@ -0,0 +1,163 @@
+from typing import Dict, Any, List, Mapping, Optional, Tuple
+import logging
+import threading
+import numpy as np
+import pandas as pd
+from datavault_assistant.configs.settings import ParserConfig
+
+def _first_hit(index: Dict[Any, Tuple[int, Dict[str, Any]]], keys: List[Any]) -> Optional[Tuple[int, Dict[str, Any]]]:
+    """Earliest indexed (position, row) among keys, i.e. the row an isin() filter on the DataFrame would return first"""
+    best = None
+    for key in keys:
+        hit = index.get(key)
+        if hit is not None and (best is None or hit[0] < best[0]):
+            best = hit
+    return best
+
+# Data Type Service shared by the hub, link, satellite and link satellite parsers
+class DataTypeService:
+    # LENGTH values meaning "no length", VARCHAR2 then gets default_varchar_length
+    _INVALID_LENGTHS = frozenset(('-', ' ', 'nan'))
+    # One logger for all instances, every parser owns a service
+    logger = logging.getLogger('DataTypeService')
+    
+    def __init__(self, config: ParserConfig):
+        self.config = config
+        # VARCHAR2 type used when a column has no usable length or is not in the mapping data
+        self._default_varchar = f"VARCHAR2({config.default_varchar_length})"
+        # Row indexes of the last mapping DataFrame seen; mapping data is treated as read-only
+        self._lock = threading.Lock()
+        self._indexed_df: Optional[pd.DataFrame] = None
+        self._by_column: Dict[Any, Tuple[int, Dict[str, Any]]] = {}
+        self._by_table_column: Dict[Tuple[Any, Any], Tuple[int, Dict[str, Any]]] = {}
+        self._by_table: Dict[Any, Tuple[int, Dict[str, Any]]] = {}
+        # Output data_type of every row by position, None where it is left to _process_column_type
+        self._resolved_types: Optional[List[Any]] = None
+        # Column type dicts already built for (column, source_tables), shared by entities with the same keys
+        self._memo: Dict[Tuple[str, Optional[Tuple[str, ...]]], Dict[str, Any]] = {}
+        
+    def clear_cache(self) -> None:
+        """Drop the indexes and memoized column types of the last mapping DataFrame"""
+        with self._lock:
+            self._indexed_df = None
+            self._by_column, self._by_table_column, self._by_table = {}, {}, {}
+            self._resolved_types = None
+            self._memo = {}
+        
+    def _index(self, mapping_df: pd.DataFrame) -> None:
+        """Index the first row per COLUMN_NAME, TABLE_NAME and (TABLE_NAME, COLUMN_NAME), once per DataFrame"""
+        with self._lock:
+            if self._indexed_df is mapping_df:
+                return
+            by_column, by_table_column, by_table = {}, {}, {}
+            has_table = 'TABLE_NAME' in mapping_df.columns
+            for position, row in enumerate(mapping_df.to_dict('records')):
+                by_column.setdefault(row['COLUMN_NAME'], (position, row))
+                if has_table:
+                    by_table_column.setdefault((row['TABLE_NAME'], row['COLUMN_NAME']), (position, row))
+                    by_table.setdefault(row['TABLE_NAME'], (position, row))
+            self._by_column, self._by_table_column, self._by_table = by_column, by_table_column, by_table
+            self._resolved_types = self._resolve_data_types(mapping_df)
+            self._memo = {}
+            self._indexed_df = mapping_df
+            
+    def _resolve_data_types(self, mapping_df: pd.DataFrame) -> Optional[List[Any]]:
+        """Output data_type of all rows in one vectorized pass (VARCHAR2 gets its length or the default)"""
+        if 'DATA_TYPE' not in mapping_df.columns or mapping_df.empty:
+            return None
+        data_types = mapping_df['DATA_TYPE']
+        if isinstance(data_types.dtype, pd.CategoricalDtype):
+            # Categorical mapping columns (ParserConfig.mapping_dtypes) resolve like plain text
+            data_types = data_types.astype(object)
+        if not pd.api.types.is_string_dtype(data_types):
+            return None
+        if 'LENGTH' in mapping_df.columns:
+            lengths = mapping_df['LENGTH'].astype(str).str.strip()
+        else:
+            lengths = pd.Series('', index=mapping_df.index)
+        is_varchar = data_types.str.upper().eq('VARCHAR2').to_numpy(dtype=bool, na_value=False)
+        has_length = (lengths.ne('') & ~lengths.str.lower().isin(self._INVALID_LENGTHS)).to_numpy()
+        resolved = np.where(
+            is_varchar,
+            np.where(has_length, ('VARCHAR2(' + lengths + ')').to_numpy(dtype=object),
+                     self._default_varchar),
+            data_types.to_numpy(dtype=object)
+        )
+        # Rows whose DATA_TYPE is not text keep the per-row path and its error handling
+        is_text = data_types.map(type).eq(str).to_numpy()
+        return np.where(is_text, resolved, None).tolist()
+            
+    def _find_hit(self, col: str, source_tables: Optional[List[str]]) -> Optional[Tuple[int, Dict[str, Any]]]:
+        if source_tables is None:
+            return self._by_column.get(col)
+        return _first_hit(self._by_table_column, [(table, col) for table in source_tables])
+    
+    def lookup_source_schema(self, mapping_df: pd.DataFrame, source_tables: List[str]) -> Optional[Any]:
+        """SCHEMA_NAME of the first mapping row of source_tables, None when none of them is in mapping_df"""
+        self._index(mapping_df)
+        hit = _first_hit(self._by_table, source_tables)
+        return hit[1]['SCHEMA_NAME'] if hit is not None else None
+        
+    def lookup_datatypes(self, columns: List[str], mapping_df: pd.DataFrame,
+                         source_tables: Optional[List[str]] = None) -> Dict[str, Dict]:
+        """Resolve column types from mapping_df, restricted to source_tables when given"""
+        # mapping_df is indexed once and reused by every hub/link/satellite of the run,
+        # so each column is a dict probe instead of a DataFrame scan
+        self._index(mapping_df)
+        memo = self._memo
+        tables_key = tuple(source_tables) if source_tables is not None else None
+        
+        result = {}
+        for col in columns:
+            cached = memo.get((col, tables_key))
+            if cached is not None:
+                result[col] = cached
+                continue
+            try:
+                hit = self._find_hit(col, source_tables)
+                if hit is None:
+                    result[col] = self._get_default_type(col)
+                    self.logger.warning("Column %s not found in mapping data, using default type", col)
+                else:
+                    position, column_info = hit
+                    result[col] = memo[(col, tables_key)] = self._process_column_type(
+                        col, column_info,
+                        self._resolved_types[position] if self._resolved_types is not None else None
+                    )
+            except Exception as e:
+                self.logger.error("Error processing column %s: %s", col, e)
+                raise
+        return result
+    
+    def _process_column_type(self, col: str, column_info: Mapping[str, Any],
+                             resolved_type: Optional[str] = None) -> Dict[str, Any]:
+        try:
+            data_type = column_info['DATA_TYPE']
+            length = str(column_info.get('LENGTH', '')).strip()
+            
+            if resolved_type is not None:
+                data_type = resolved_type
+            elif data_type.upper() == 'VARCHAR2':
+                data_type = self._process_varchar(length)
+                
+            return {
+                'data_type': data_type,
+                'original_type': column_info['DATA_TYPE'],
+                'length': length,
+                'nullable': column_info.get('NULLABLE', True),
+                'description': column_info.get('DESCRIPTION', '')
+            }
+        except KeyError as e:
+            self.logger.error("Missing required column in mapping data: %s", e)
+            return self._get_default_type(col)
+    
+    def _get_default_type(self, col: str) -> Dict[str, Any]:
+        return {
+            'error': f"Column {col} not found in mapping data",
+            'data_type': self._default_varchar
+        }
+        
+    def _process_varchar(self, length: str) -> str:
+        if length and length.lower() not in self._INVALID_LENGTHS:
+            return f"VARCHAR2({length})"
+        return self._default_varchar
@@ -9,23 +9,22 @@ import pandas as pd
 from datetime import datetime
 import numpy as np
 from datavault_assistant.configs.settings import ParserConfig
+from datavault_assistant.core.nodes.datatype_service import DataTypeService
+from datavault_assistant.core.utils.log_handler import init_logging
 
 
 class DataVaultParserException(Exception):
     """Custom exception for Data Vault Parser errors"""
     pass
 
+# Fields every hub definition must have
+_REQUIRED_HUB_FIELDS = frozenset({'name', 'business_keys', 'source_tables', 'description'})
+
 # Enhanced Logging Mixin
 class LoggingMixin:
     def setup_logging(self):
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('datavault_parser.log'),
-                logging.StreamHandler()
-            ]
-        )
+        # Records are queued and written to file/console by one listener thread
+        init_logging('datavault_parser.log')
         return logging.getLogger(self.__class__.__name__)
 
 # Abstract Parser Interface
@@ -38,102 +37,54 @@ class DataVaultParser(ABC):
     def validate(self) -> List[str]:
         pass
 
-# Data Type Service
-class DataTypeService:
-    def __init__(self, config: ParserConfig):
-        self.config = config
-        self.logger = logging.getLogger(self.__class__.__name__)
-        
-    def lookup_datatypes(self, business_keys: List[str], mapping_df: pd.DataFrame) -> Dict[str, Dict]:
-        result = {}
-        for key in business_keys:
-            try:
-                filtered_df = mapping_df[mapping_df['COLUMN_NAME'] == key]
-                if filtered_df.empty:
-                    result[key] = self._get_default_type(key)
-                    self.logger.warning(f"Column {key} not found in mapping data, using default type")
-                else:
-                    column_info = filtered_df.iloc[0]
-                    result[key] = self._process_column_type(key, column_info)
-            except Exception as e:
-                self.logger.error(f"Error processing column {key}: {str(e)}")
-                raise
-        return result
-    
-    def _get_default_type(self, col: str) -> Dict[str, Any]:
-        return {
-            'error': f'Column {col} not found in mapping data',
-            'data_type': f'VARCHAR2({self.config.default_varchar_length})'
-        }
-    
-    def _process_column_type(self, col: str, column_info: pd.Series) -> Dict[str, Any]:
-        try:
-            data_type = column_info['DATA_TYPE']
-            length = str(column_info.get('LENGTH', '')).strip()
-            
-            if data_type.upper() == 'VARCHAR2':
-                data_type = self._process_varchar(length)
-                
-            return {
-                'data_type': data_type,
-                'original_type': column_info['DATA_TYPE'],
-                'length': length,
-                'nullable': column_info.get('NULLABLE', True),
-                'description': column_info.get('DESCRIPTION', '')
-            }
-        except KeyError as e:
-            self.logger.error(f"Missing required column in mapping data: {e}")
-            return self._get_default_type(col)
-            
-    def _process_varchar(self, length: str) -> str:
-        import numpy as np
-        if length and length.lower() not in ['-', ' ','nan']:
-            return f"VARCHAR2({length})"
-        return f"VARCHAR2({self.config.default_varchar_length})"
-
 # Hub Parser Implementation
 class HubParser(DataVaultParser, LoggingMixin):
     def __init__(self, config: ParserConfig):
         self.config = config
         self.logger = self.setup_logging()
         self.datatype_service = DataTypeService(config)
+        # Config values written upper-cased into every output document
+        self._target_schema = config.target_schema.upper()
+        self._collision_code = config.collision_code.upper()
+        # Shared created_at for every entity of a processing batch, set by DataProcessor
+        self._batch_now: Optional[str] = None
         
     def parse(self, hub_data: Dict[str, Any], mapping_df: pd.DataFrame) -> Dict[str, Any]:
         """Main parsing method for hub metadata"""
         try:
-            self.logger.info(f"Parsing hub: {hub_data['name']}")
+            self.logger.info("Parsing hub: %s", hub_data['name'])
             
             # Validate and get warnings
-            self.logger.info(f"validate hub: {hub_data['name']}")
+            self.logger.debug("validate hub: %s", hub_data['name'])
             validation_warnings = self.validate(hub_data)
             
             
             # Get source schema and validate
-            self.logger.info(f"Get source schema and validate hub: {hub_data['name']}")
-            filtered_df = mapping_df[mapping_df['TABLE_NAME'].isin(hub_data["source_tables"])]
-            source_schema = self._get_source_schema(filtered_df)
+            self.logger.debug("Get source schema and validate hub: %s", hub_data['name'])
+            source_schema = self._get_source_schema(mapping_df, hub_data["source_tables"])
             
             
             # Get datatypes for business keys
-            self.logger.info(f"Get datatypes for business keys: {hub_data['name']}")
-            datatype_info = self.datatype_service.lookup_datatypes(hub_data["business_keys"], filtered_df)
+            self.logger.debug("Get datatypes for business keys: %s", hub_data['name'])
+            datatype_info = self.datatype_service.lookup_datatypes(
+                hub_data["business_keys"], mapping_df, hub_data["source_tables"]
+            )
             
-            self.logger.info(f"Get output yml format file: {hub_data['name']}")
+            self.logger.debug("Get output yml format file: %s", hub_data['name'])
             return self._build_output_dict(hub_data, source_schema, datatype_info, validation_warnings)
             
         except Exception as e:
-            self.logger.error(f"Error in hub transformation: {str(e)}")
+            self.logger.error("Error in hub transformation: %s", e)
             raise
     
     def validate(self, hub_data: Dict[str, Any]) -> List[str]:
         """Validate hub metadata"""
         warnings = []
-        required_fields = ['name', 'business_keys', 'source_tables', 'description']
         
         # Check required fields
-        for field in required_fields:
-            if field not in hub_data:
-                raise DataVaultParserException(f"Missing required field: {field}")
+        missing = _REQUIRED_HUB_FIELDS - hub_data.keys()
+        if missing:
+            raise DataVaultParserException(f"Missing required field: {', '.join(sorted(missing))}")
         
         # Validate business keys
         if not hub_data['business_keys']:
@@ -145,60 +96,60 @@ class HubParser(DataVaultParser, LoggingMixin):
             
         return warnings
         
-    def _get_source_schema(self, filtered_df: pd.DataFrame) -> str:
+    def _get_source_schema(self, mapping_df: pd.DataFrame, source_tables: List[str]) -> str:
         """Get source schema from mapping DataFrame"""
-        if filtered_df.empty:
+        source_schema = self.datatype_service.lookup_source_schema(mapping_df, source_tables)
+        if source_schema is None:
             raise ValueError("Could not determine source schema from mapping data")
-        return filtered_df['SCHEMA_NAME'].iloc[0]
+        return source_schema
     
     def _build_metadata(self, warnings: List[str]) -> Dict[str, Any]:
         """Build metadata section"""
         return {
-            "created_at": datetime.now().isoformat(),
+            "created_at": self._batch_now or datetime.now().isoformat(),
             "version": self.config.version,
             "validation_status": "valid" if not warnings else "warnings",
             "validation_warnings": warnings if warnings else None
         }
         
-    def _build_columns(self, hub_data: Dict[str, Any], datatype_info: Dict[str, Dict]) -> List[Dict[str, Any]]:
+    def _build_columns(self, hub_data: Dict[str, Any], datatype_info: Dict[str, Dict],
+                       hub_name: Optional[str] = None) -> List[Dict[str, Any]]:
         """Build columns section"""
-        columns = []
+        hub_name = hub_name or hub_data["name"].upper()
+        business_keys = hub_data["business_keys"]
         
-        # Add hash key column
-        columns.append({
-            "target": f"DV_HKEY_{hub_data['name'].upper()}",
+        # Hash key column, then one column per business key
+        columns = [{
+            "target": f"DV_HKEY_{hub_name}",
             "dtype": "raw",
             "key_type": "hash_key_hub",
-            "source": [
-                key for key in hub_data["business_keys"]
-            ]
-        })
-        
-        # Add business key columns
-        for biz_key in hub_data["business_keys"]:
+            "source": list(business_keys)
+        }]
+        for biz_key in business_keys:
+            data_type = datatype_info[biz_key]['data_type']
             columns.append({
                 "target": f"{biz_key}",
-                "dtype": datatype_info[biz_key]['data_type'],
+                "dtype": data_type,
                 "key_type": "biz_key",
                 "source": {
                     "name": biz_key,
-                    "dtype": datatype_info[biz_key]['data_type']
+                    "dtype": data_type
                 }
             })
-            
         return columns
         
     def _build_output_dict(self, hub_data: Dict[str, Any], source_schema: str,
                           datatype_info: Dict[str, Dict], warnings: List[str]) -> Dict[str, Any]:
         """Build the output dictionary"""
+        hub_name = hub_data["name"].upper()
         return {
             "source_schema": source_schema.upper(),
             "source_table": hub_data["source_tables"][0].upper(),
-            "target_schema": self.config.target_schema.upper(),
-            "target_table": hub_data["name"].upper(),
+            "target_schema": self._target_schema,
+            "target_table": hub_name,
             "target_entity_type": "hub",
-            "collision_code": self.config.collision_code.upper(),
+            "collision_code": self._collision_code,
             "description": hub_data["description"],
             "metadata": self._build_metadata(warnings),
-            "columns": self._build_columns(hub_data, datatype_info)
+            "columns": self._build_columns(hub_data, datatype_info, hub_name)
         }
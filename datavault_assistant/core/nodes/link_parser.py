@@ -1,6 +1,5 @@
-from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Dict, Any, List, Set, Optional
+from typing import Dict, Any, List, Set, Optional, AbstractSet, Iterable, Union
 from pathlib import Path
 import logging
 import json
@@ -8,88 +7,14 @@ import yaml
 import pandas as pd
 from datetime import datetime
 from datavault_assistant.configs.settings import ParserConfig
+from datavault_assistant.core.nodes.datatype_service import DataTypeService
+from datavault_assistant.core.nodes.hub_parser import DataVaultParser, LoggingMixin
 
 # Configuration using dataclass
 class DataVaultValidationError(Exception):
     """Custom exception for Data Vault validation errors"""
     pass
 
-# Enhanced Logging Mixin
-class LoggingMixin:
-    def setup_logging(self):
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('datavault_parser.log'),
-                logging.StreamHandler()
-            ]
-        )
-        return logging.getLogger(self.__class__.__name__)
-
-# Abstract Parser Interface
-class DataVaultParser(ABC):
-    @abstractmethod
-    def parse(self) -> Dict[str, Any]:
-        pass
-    
-    @abstractmethod
-    def validate(self) -> List[str]:
-        pass
-
-# Data Type Service
-class DataTypeService:
-    def __init__(self, config: ParserConfig):
-        self.config = config
-        self.logger = logging.getLogger(self.__class__.__name__)
-        
-    def lookup_datatypes(self, business_keys: List[str], mapping_df: pd.DataFrame) -> Dict[str, Dict]:
-        result = {}
-        for key in business_keys:
-            try:
-                filtered_df = mapping_df[mapping_df['COLUMN_NAME'] == key]
-                if filtered_df.empty:
-                    result[key] = self._get_default_type(key)
-                    self.logger.warning(f"Column {key} not found in mapping data, using default type")
-                else:
-                    column_info = filtered_df.iloc[0]
-                    result[key] = self._process_column_type(key, column_info)
-            except Exception as e:
-                self.logger.error(f"Error processing column {key}: {str(e)}")
-                raise
-        return result
-
-    def _get_default_type(self, col: str) -> Dict[str, Any]:
-        return {
-            'error': f'Column {col} not found in mapping data',
-            'data_type': f'VARCHAR2({self.config.default_varchar_length})'
-        }
-        
-    def _process_column_type(self, col: str, column_info: pd.Series) -> Dict[str, Any]:
-        try:
-            data_type = column_info['DATA_TYPE']
-            length = str(column_info.get('LENGTH', '')).strip()
-            
-            if data_type.upper() == 'VARCHAR2':
-                data_type = self._process_varchar(length)
-                
-            return {
-                'data_type': data_type,
-                'original_type': column_info['DATA_TYPE'],
-                'length': length,
-                'nullable': column_info.get('NULLABLE', True),
-                'description': column_info.get('DESCRIPTION', '')
-            }
-        except KeyError as e:
-            self.logger.error(f"Missing required column in mapping data: {e}")
-            return self._get_default_type(col)
-            
-    def _process_varchar(self, length: str) -> str:
-        import numpy as np
-        if length and length.lower() not in ['-', ' ','nan']:
-            return f"VARCHAR2({length})"
-        return f"VARCHAR2({self.config.default_varchar_length})"
-
 # Hub Metadata Service
 class HubMetadataService:
     def __init__(self):
@@ -98,20 +23,24 @@ class HubMetadataService:
         
     def cache_hubs_metadata(self, data: Dict[str, Any]) -> None:
         self.logger.info("Caching hubs metadata")
+        # Key sets are built once here and shared read-only by every link referencing the hub
         self.hubs_metadata = {
             hub["name"]: {
-                "business_keys": set(hub["business_keys"]),
-                "source_tables": set(hub["source_tables"])
+                "business_keys": frozenset(hub["business_keys"]),
+                "source_tables": frozenset(hub["source_tables"])
             }
             for hub in data.get("hubs", [])
         }
         
-    def get_hub_business_keys(self, hub_name: str, link_keys: List[str]) -> Set[str]:
+    def get_hub_business_keys(self, hub_name: str, link_keys: Union[AbstractSet[str], Iterable[str]]) -> AbstractSet[str]:
         if hub_name not in self.hubs_metadata:
             raise DataVaultValidationError(f"Unknown hub: {hub_name}")
             
         hub_keys = self.hubs_metadata[hub_name]["business_keys"]
-        return set(link_keys).intersection(hub_keys)
+        # Callers looping over hubs pass a prebuilt frozenset to avoid rebuilding it per hub
+        if not isinstance(link_keys, (set, frozenset)):
+            link_keys = frozenset(link_keys)
+        return link_keys & hub_keys
 
 # Link Parser Implementation
 class LinkParser(DataVaultParser, LoggingMixin):
@@ -119,51 +48,58 @@ class LinkParser(DataVaultParser, LoggingMixin):
         self.config = config
         self.logger = self.setup_logging()
         self.datatype_service = DataTypeService(config)
+        # Config values written upper-cased into every output document
+        self._target_schema = config.target_schema.upper()
+        self._collision_code = config.collision_code.upper()
+        # Shared created_at for every entity of a processing batch, set by DataProcessor
+        self._batch_now: Optional[str] = None
         self.hub_service = HubMetadataService()
         
     def parse(self, link_data: Dict[str, Any], mapping_df: pd.DataFrame) -> Dict[str, Any]:
         """Main parsing method for link metadata"""
         try:
-            self.logger.info(f"Parsing link: {link_data['name']}")
+            self.logger.info("Parsing link: %s", link_data['name'])
             
             # Get source schema and validate
-            filtered_df = mapping_df[mapping_df['TABLE_NAME'].isin(link_data["source_tables"])]
-            source_schema = self._get_source_schema(filtered_df)
+            source_schema = self._get_source_schema(mapping_df, link_data["source_tables"])
             
             # Validate and get data types
             validation_warnings = self.validate(link_data)
-            datatype_info = self.datatype_service.lookup_datatypes(link_data["business_keys"], filtered_df)
+            datatype_info = self.datatype_service.lookup_datatypes(
+                link_data["business_keys"], mapping_df, link_data["source_tables"]
+            )
             
             return self._build_output_dict(link_data, source_schema, datatype_info, validation_warnings)
             
         except Exception as e:
-            self.logger.error(f"Error in link transformation: {str(e)}")
+            self.logger.error("Error in link transformation: %s", e)
             raise
     
     def validate(self, link_data: Dict[str, Any]) -> List[str]:
         """Validate link metadata"""
         warnings = []
-        link_keys = set(link_data["business_keys"])
+        link_keys = frozenset(link_data["business_keys"])
         link_name = link_data["name"]
+        hubs_metadata = self.hub_service.hubs_metadata
         
-        # Collect all hub business keys
-        all_hub_keys = set()
+        # Resolve every related hub first, both errors below are raised before any warning is built
+        hub_keysets = []
         for hub_name in link_data["related_hubs"]:
-            if hub_name not in self.hub_service.hubs_metadata:
+            hub_metadata = hubs_metadata.get(hub_name)
+            if hub_metadata is None:
                 raise DataVaultValidationError(f"Link {link_name} references non-existent hub: {hub_name}")
-                
-            hub_keys = self.hub_service.hubs_metadata[hub_name]["business_keys"]
-            all_hub_keys.update(hub_keys)
-            
-            warnings.extend(self._validate_hub_keys(link_name, hub_name, link_keys, hub_keys))
+            hub_keysets.append((hub_name, hub_metadata["business_keys"]))
             
         # Check extra keys
-        extra_keys = link_keys - all_hub_keys
+        extra_keys = link_keys.difference(*(hub_keys for _, hub_keys in hub_keysets))
         if extra_keys:
             raise DataVaultValidationError(
-                f"Link {link_name} contains business keys that don't belong to any related hub: {sorted(list(extra_keys))}"
+                f"Link {link_name} contains business keys that don't belong to any related hub: {sorted(extra_keys)}"
             )
             
+        for hub_name, hub_keys in hub_keysets:
+            warnings.extend(self._validate_hub_keys(link_name, hub_name, link_keys, hub_keys))
+            
         return warnings
     
     def _validate_hub_keys(self, link_name: str, hub_name: str, 
@@ -174,27 +110,27 @@ class LinkParser(DataVaultParser, LoggingMixin):
         missing_keys = hub_keys - link_keys
         if missing_keys:
             warnings.append(
-                f"Link {link_name} is missing business keys from hub {hub_name}: {sorted(list(missing_keys))}"
+                f"Link {link_name} is missing business keys from hub {hub_name}: {sorted(missing_keys)}"
             )
         
         # Check if link has any keys from this hub
-        hub_related_keys = link_keys.intersection(hub_keys)
-        if not hub_related_keys:
+        if link_keys.isdisjoint(hub_keys):
             warnings.append(
                 f"Link {link_name} has no business keys from hub {hub_name}"
             )
             
         return warnings
     
-    def _get_source_schema(self, filtered_df: pd.DataFrame) -> str:
-        if filtered_df.empty:
+    def _get_source_schema(self, mapping_df: pd.DataFrame, source_tables: List[str]) -> str:
+        source_schema = self.datatype_service.lookup_source_schema(mapping_df, source_tables)
+        if source_schema is None:
             raise ValueError("Could not determine source schema from mapping data")
-        return filtered_df['SCHEMA_NAME'].iloc[0]
+        return source_schema
     
     def _build_metadata(self, warnings: List[str]) -> Dict[str, Any]:
         """Build metadata section"""
         return {
-            "created_at": datetime.now().isoformat(),
+            "created_at": self._batch_now or datetime.now().isoformat(),
             "version": self.config.version,
             "validation_status": "valid" if not warnings else "warnings",
             "validation_warnings": warnings if warnings else None
@@ -209,14 +145,13 @@ class LinkParser(DataVaultParser, LoggingMixin):
             "target": f"DV_HKEY_{link_data['name'].upper()}",
             "dtype": "raw",
             "key_type": "hash_key_lnk",
-            "source": [
-                key for key in link_data["business_keys"]
-            ]
+            "source": list(link_data["business_keys"])
         })
         
         # Add hub hash keys
+        link_keys = frozenset(link_data["business_keys"])
         for hub_name in link_data["related_hubs"]:
-            hub_keys = self.hub_service.get_hub_business_keys(hub_name, link_data["business_keys"])
+            hub_keys = self.hub_service.get_hub_business_keys(hub_name, link_keys)
             columns.append({
                 "target": f"DV_HKEY_{hub_name.upper()}",
                 "dtype": "raw",
@@ -238,10 +173,10 @@ class LinkParser(DataVaultParser, LoggingMixin):
         return {
             "source_schema": source_schema.upper(),
             "source_table": link_data["source_tables"][0].upper(),
-            "target_schema": self.config.target_schema.upper(),
+            "target_schema": self._target_schema,
             "target_table": link_data["name"].upper(),
             "target_entity_type": "lnk",
-            "collision_code": self.config.collision_code.upper(),
+            "collision_code": self._collision_code,
             "description": link_data["description"],
             "metadata": self._build_metadata(warnings),
             "columns": self._build_columns(link_data, datatype_info)
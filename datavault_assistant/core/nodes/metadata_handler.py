@@ -6,7 +6,7 @@ import os
 from fastapi import UploadFile
 import logging
 from pydantic import BaseModel
-from datavault_assistant.core.nodes.data_vault_builder import DataVaultAnalyzer
+from datavault_assistant.core.nodes.data_vault_builder import DataVaultAnalyzer, compact_metadata
 
 # Configure logging
 logging.basicConfig(
@@ -15,6 +15,14 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def read_excel(file_path: Union[str, Path]) -> pd.DataFrame:
+    """Read an Excel sheet with the calamine engine when available, falling back to pandas' default engine"""
+    try:
+        return pd.read_excel(file_path, engine='calamine')
+    except ImportError:
+        # python-calamine not installed
+        return pd.read_excel(file_path)
+
 class MetadataConfig(BaseModel):
     """Configuration for metadata handling"""
     required_columns: list = [
@@ -49,7 +57,7 @@ class MetadataHandler:
         file_path = Path(file_path)
         try:
             if file_path.suffix.lower() in ['.xlsx', '.xls', '.xlsm']:
-                return pd.read_excel(file_path)
+                return read_excel(file_path)
             elif file_path.suffix.lower() == '.csv':
                 return pd.read_csv(file_path)
             else:
@@ -61,8 +69,7 @@ class MetadataHandler:
     def process_metadata(self, df: pd.DataFrame) -> str:
         """Process DataFrame into metadata string"""
         try:
-            df = df.fillna('')
-            return df.to_string(index=False)
+            return compact_metadata(df)
         except Exception as e:
             logger.error(f"Metadata processing failed: {str(e)}")
             raise
@@ -121,7 +128,8 @@ class MetadataHandler:
             temp_path = await self._save_upload_file(file)
             result = self.read_metadata_source(temp_path)
             # Optional: Process with analyzer if needed
-            analyzed_result = self.analyzer.analyze(result)
+            # Await the LLM calls so the event loop keeps serving other requests
+            analyzed_result = await self.analyzer.aanalyze(result)
             
             return {
                 "metadata": result,
@@ -0,0 +1,190 @@
+import asyncio
+import functools
+import hashlib
+import inspect
+import logging
+import shelve
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from datavault_assistant.configs.settings import settings
+from datavault_assistant.core.utils import json_handler
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "datavault_assistant"
+# Responses kept in memory so repeated calls in one process skip opening the shelve
+MEMORY_CACHE_SIZE = 256
+# Default cap of responses kept on disk
+DEFAULT_MAX_ENTRIES = 1000
+
+class LLMResponseCache:
+    """Small on-disk LRU cache of LLM responses keyed by a content hash
+
+    Entries are stored as (last access time, response); once there are more than
+    max_entries, the least recently used ones are evicted.
+    """
+    def __init__(self, cache_dir: Optional[Path] = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR)
+        self.max_entries = max_entries
+        # _lock guards the in-memory layer only, so memory hits never wait on disk I/O;
+        # _file_lock serializes shelve access, which is not safe to open concurrently
+        self._lock = threading.Lock()
+        self._file_lock = threading.Lock()
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        digest = hashlib.blake2b(digest_size=32)
+        for part in parts:
+            digest.update(part.encode('utf-8'))
+            digest.update(b"\x1f")
+        return digest.hexdigest()
+
+    def _open(self):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        return shelve.open(str(self.cache_dir / "llm_cache"))
+
+    def _remember(self, key: str, value: str) -> None:
+        """Store a response in the in-memory layer, evicting the least recently used one"""
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        if len(self._memory) > MEMORY_CACHE_SIZE:
+            self._memory.popitem(last=False)
+
+    @staticmethod
+    def _entry_value(entry: Any) -> Optional[str]:
+        # Entries written before eviction existed are plain strings
+        if isinstance(entry, tuple):
+            return entry[1]
+        return entry
+
+    def _evict(self, db) -> None:
+        """Drop the least recently used entries down to 90% of max_entries, so eviction does not run on every write"""
+        keep = int(self.max_entries * 0.9)
+        accessed = {}
+        for key in db.keys():
+            entry = db[key]
+            accessed[key] = entry[0] if isinstance(entry, tuple) else 0.0
+        by_access = sorted(accessed, key=accessed.get)
+        for key in by_access[:len(by_access) - keep]:
+            del db[key]
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                return value
+        try:
+            with self._file_lock, self._open() as db:
+                entry = db.get(key)
+                value = self._entry_value(entry)
+                if value is not None:
+                    # Refresh the access time so entries in use are not evicted
+                    db[key] = (time.time(), value)
+        except Exception as e:
+            logger.warning("LLM cache read failed: %s", e)
+            return None
+        if value is not None:
+            with self._lock:
+                self._remember(key, value)
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._remember(key, value)
+        try:
+            with self._file_lock, self._open() as db:
+                db[key] = (time.time(), value)
+                if len(db) > self.max_entries:
+                    self._evict(db)
+        except Exception as e:
+            logger.warning("LLM cache write failed: %s", e)
+
+@functools.lru_cache(maxsize=None)
+def get_llm_cache() -> LLMResponseCache:
+    return LLMResponseCache(settings.LLM_CACHE_DIR, settings.LLM_CACHE_MAX_ENTRIES)
+
+def _llm_identity(llm: Any) -> str:
+    """Describe the model so responses from different models/settings never share a key"""
+    params = getattr(llm, "_identifying_params", None)
+    if params is None:
+        return type(llm).__name__
+    return f"{type(llm).__name__}:{sorted(params.items(), key=lambda item: item[0])!r}"
+
+def llm_cache_key(owner: Any, prompt_version: str, *inputs: Any) -> str:
+    """Cache key of an analyzer call: analyzer class, prompt version, model and the string inputs"""
+    return LLMResponseCache.make_key(type(owner).__name__, prompt_version, _llm_identity(owner.llm),
+                                     *[str(value) for value in inputs])
+
+def _is_cacheable(result: Any) -> bool:
+    """Only responses that parse as JSON are stored, so one bad generation is retried instead of pinned"""
+    if result is None:
+        return False
+    try:
+        json_handler.loads(result)
+        return True
+    except Exception as e:
+        logger.warning("Not caching LLM response that is not valid JSON: %s", e)
+        return False
+
+def cached_llm_call(prompt_version: str) -> Callable:
+    """Cache an analyzer method's result on disk, keyed by its string inputs, the model and prompt_version"""
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        def make_key(self, args, kwargs) -> str:
+            # Bind to the signature so positional and keyword calls, sync and async, share entries
+            bound = signature.bind(self, *args, **kwargs)
+            return llm_cache_key(self, prompt_version, *[value for name, value in bound.arguments.items() if name != "self"])
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                if not settings.LLM_CACHE_ENABLED:
+                    return await func(self, *args, **kwargs)
+                cache = get_llm_cache()
+                key = make_key(self, args, kwargs)
+                # Shelve I/O is blocking, keep it off the event loop
+                result = await asyncio.to_thread(cache.get, key)
+                if result is None:
+                    result = await func(self, *args, **kwargs)
+                    # Failed calls and invalid JSON are not stored and are retried next time
+                    if _is_cacheable(result):
+                        await asyncio.to_thread(cache.set, key, result)
+                return result
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if not settings.LLM_CACHE_ENABLED:
+                return func(self, *args, **kwargs)
+            cache = get_llm_cache()
+            key = make_key(self, args, kwargs)
+            result = cache.get(key)
+            if result is None:
+                result = func(self, *args, **kwargs)
+                if _is_cacheable(result):
+                    cache.set(key, result)
+            return result
+        return wrapper
+    return decorator
+
+def get_cached_batch(owner: Any, prompt_version: str,
+                     inputs: Sequence[Tuple[Any, ...]]) -> Tuple[List[Optional[str]], List[Optional[str]]]:
+    """Cached responses (None where missing) and cache keys of a batch, with the same keys as cached_llm_call"""
+    if not settings.LLM_CACHE_ENABLED:
+        return [None] * len(inputs), [None] * len(inputs)
+    cache = get_llm_cache()
+    keys = [llm_cache_key(owner, prompt_version, *item) for item in inputs]
+    return [cache.get(key) for key in keys], keys
+
+def store_cached_batch(keys: Sequence[Optional[str]], results: Sequence[Optional[str]]) -> None:
+    """Store the valid responses of a batch under the keys returned by get_cached_batch"""
+    for key, result in zip(keys, results):
+        if key is not None and _is_cacheable(result):
+            get_llm_cache().set(key, result)
@@ -1,6 +1,7 @@
 from langchain_ollama import ChatOllama
 from langchain_groq import ChatGroq
 from typing import Optional
+from functools import lru_cache
 from datavault_assistant.configs.settings import settings
 
 class LLMFactory:
@@ -26,7 +27,12 @@ class LLMFactory:
         """
         
         temperature = temperature or settings.DEFAULT_TEMPERATURE
-        
+        return LLMFactory._create_llm(provider, model, temperature)
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _create_llm(provider: str, model: Optional[str], temperature: float):
+        """Tạo LLM instance, cache theo (provider, model, temperature) để các request dùng chung client và chain"""
         if provider == "ollama":
             return ChatOllama(
                 base_url=settings.OLLAMA_BASE_URL,
@@ -1,4 +1,9 @@
+import atexit
 import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
 
 def create_logger(name: str, log_file: str, level: int = logging.INFO) -> logging.Logger:
     logger = logging.getLogger(name)
@@ -23,5 +28,40 @@ def create_logger(name: str, log_file: str, level: int = logging.INFO) -> loggin
     
     return logger
 
-# Example usage
-logger = create_logger(__name__, 'datavault_analyzer.log')
+_listener: Optional[QueueListener] = None
+
+def _log_directly_in_child() -> None:
+    """A forked child (e.g. a parse worker) has no listener thread, so hand records straight to the handlers"""
+    global _listener
+    if _listener is None:
+        return
+    root = logging.getLogger()
+    for handler in [h for h in root.handlers if isinstance(h, QueueHandler)]:
+        root.removeHandler(handler)
+    for handler in _listener.handlers:
+        root.addHandler(handler)
+    _listener = None
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_log_directly_in_child)
+
+def init_logging(log_file: str = 'datavault_analyzer.log', level: int = logging.INFO) -> None:
+    """Configure root logging to file and console. Call from entry points, not at import time."""
+    global _listener
+    root = logging.getLogger()
+    if _listener is not None or root.handlers:
+        return
+
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler(log_file)
+    stream_handler = logging.StreamHandler()
+    file_handler.setFormatter(formatter)
+    stream_handler.setFormatter(formatter)
+
+    # Callers only enqueue records; file and console writes happen on the listener thread
+    log_queue = queue.Queue(-1)
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(level)
+    _listener = QueueListener(log_queue, file_handler, stream_handler)
+    _listener.start()
+    atexit.register(_listener.stop)
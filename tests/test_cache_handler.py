@@ -0,0 +1,122 @@
+import asyncio
+import pytest
+from datavault_assistant.core.utils import cache_handler
+from datavault_assistant.core.utils.cache_handler import LLMResponseCache, cached_llm_call
+
+class FakeAnalyzer:
+    """Analyzer giả trả lần lượt các response cho trước"""
+    def __init__(self, responses):
+        self.llm = object()
+        self.responses = list(responses)
+        self.calls = 0
+
+    @cached_llm_call("test")
+    def analyze(self, metadata: str):
+        self.calls += 1
+        return self.responses.pop(0)
+
+    @cached_llm_call("test")
+    async def aanalyze(self, metadata: str):
+        self.calls += 1
+        return self.responses.pop(0)
+
+@pytest.fixture
+def llm_cache(tmp_path, monkeypatch):
+    cache = LLMResponseCache(tmp_path)
+    monkeypatch.setattr(cache_handler.settings, "LLM_CACHE_ENABLED", True)
+    monkeypatch.setattr(cache_handler, "get_llm_cache", lambda: cache)
+    return cache
+
+def test_cached_llm_call_hit_and_miss(llm_cache):
+    """Test cùng input lấy từ cache, input khác gọi lại LLM"""
+    analyzer = FakeAnalyzer(['{"hubs": []}', '{"hubs": [1]}'])
+    assert analyzer.analyze("a") == '{"hubs": []}'
+    assert analyzer.analyze(metadata="a") == '{"hubs": []}'
+    assert analyzer.calls == 1
+    assert analyzer.analyze("b") == '{"hubs": [1]}'
+    assert analyzer.calls == 2
+
+def test_cached_llm_call_shared_by_sync_and_async(llm_cache):
+    """Test sync và async dùng chung entry cache"""
+    analyzer = FakeAnalyzer(['{"hubs": []}'])
+    assert asyncio.run(analyzer.aanalyze("a")) == '{"hubs": []}'
+    assert analyzer.analyze("a") == '{"hubs": []}'
+    assert analyzer.calls == 1
+
+@pytest.mark.parametrize("invalid", ['{"hubs": [ ,]}', None])
+def test_cached_llm_call_does_not_store_invalid_response(llm_cache, invalid):
+    """Test response không phải JSON hợp lệ không được cache, lần gọi sau lấy response mới"""
+    analyzer = FakeAnalyzer([invalid, '{"hubs": []}'])
+    assert analyzer.analyze("a") == invalid
+    assert analyzer.analyze("a") == '{"hubs": []}'
+    assert analyzer.analyze("a") == '{"hubs": []}'
+    assert analyzer.calls == 2
+
+def test_cached_llm_call_async_does_not_store_invalid_response(llm_cache):
+    """Test bản async cũng không cache response lỗi"""
+    analyzer = FakeAnalyzer(['not json', '{"hubs": []}'])
+    assert asyncio.run(analyzer.aanalyze("a")) == 'not json'
+    assert asyncio.run(analyzer.aanalyze("a")) == '{"hubs": []}'
+    assert analyzer.calls == 2
+
+def test_memory_hit_does_not_wait_for_disk(tmp_path):
+    """Test cache hit trong bộ nhớ không bị chặn khi thread khác đang đọc/ghi shelve"""
+    import threading
+    cache = LLMResponseCache(tmp_path)
+    cache.set("a", '{"hubs": []}')
+    result = []
+    with cache._file_lock:
+        reader = threading.Thread(target=lambda: result.append(cache.get("a")))
+        reader.start()
+        reader.join(timeout=5)
+    assert result == ['{"hubs": []}']
+
+def test_disk_cache_evicts_least_recently_used(tmp_path, monkeypatch):
+    """Test shelve bị giới hạn max_entries, entry lâu không dùng bị xoá trước"""
+    import itertools
+    monkeypatch.setattr(cache_handler.time, "time", itertools.count().__next__)
+    cache = LLMResponseCache(tmp_path, max_entries=10)
+    for i in range(10):
+        cache.set(f"k{i}", f'"{i}"')
+    # Đọc k0 qua instance mới (bỏ qua bộ nhớ) để cập nhật thời điểm truy cập trên đĩa
+    assert LLMResponseCache(tmp_path).get("k0") == '"0"'
+    cache.set("k10", '"10"')
+    fresh = LLMResponseCache(tmp_path)
+    with fresh._open() as db:
+        assert len(db) == 9
+    assert fresh.get("k0") == '"0"'
+    assert fresh.get("k1") is None
+    assert fresh.get("k2") is None
+    assert fresh.get("k10") == '"10"'
+
+def test_disk_cache_reads_legacy_entries(tmp_path):
+    """Test entry cũ lưu dạng string (chưa có thời điểm truy cập) vẫn đọc được"""
+    cache = LLMResponseCache(tmp_path)
+    with cache._open() as db:
+        db["a"] = '{"hubs": []}'
+    assert cache.get("a") == '{"hubs": []}'
+
+def _record_cache_threads(cache, monkeypatch):
+    """Ghi lại thread thực hiện get/set của cache"""
+    import threading
+    threads = []
+    for name in ("get", "set"):
+        method = getattr(cache, name)
+        def spy(*args, _method=method):
+            threads.append(threading.get_ident())
+            return _method(*args)
+        monkeypatch.setattr(cache, name, spy)
+    return threads
+
+def test_cached_llm_call_async_does_disk_io_off_event_loop(llm_cache, monkeypatch):
+    """Test bản async đọc/ghi cache trong worker thread, không chặn event loop"""
+    import threading
+    threads = _record_cache_threads(llm_cache, monkeypatch)
+    analyzer = FakeAnalyzer(['{"hubs": []}'])
+    async def run():
+        await analyzer.aanalyze("a")
+        await analyzer.aanalyze("a")
+        return threading.get_ident()
+    loop_thread = asyncio.run(run())
+    assert len(threads) == 3 and loop_thread not in threads
+
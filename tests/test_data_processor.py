@@ -1,7 +1,12 @@
 import pytest
+import json
+import os
+import yaml
 from pathlib import Path
 import pandas as pd
 from unittest.mock import Mock, patch
+from datavault_assistant.configs.settings import ParserConfig
+from datavault_assistant.core.nodes.data_vault_parser import DataProcessor
 
 def test_process_data_error_handling(data_processor, sample_input_data, 
                                    sample_mapping_data, tmp_path):
@@ -48,4 +53,104 @@ def test_process_link_with_hub_metadata(data_processor,sample_input_data, sample
         
         # Kiểm tra kết quả
         assert len(result["hubs"]) == 4
-        assert len(result["links"]) == 3
\ No newline at end of file
+        assert len(result["links"]) == 3
+
+TEST_DATA = Path(__file__).parent / "test_data"
+
+@pytest.fixture
+def run_processor(sample_input_data, sample_mapping_data, tmp_path):
+    """Chạy DataProcessor với ParserConfig(**options) vào tmp_path/name
+    
+    Returns:
+        (results, output_dir, outputs) với outputs là các file *_metadata.yaml đã bỏ created_at
+    """
+    def run(name="output", from_files=False, **options):
+        output_dir = tmp_path / name
+        with DataProcessor(ParserConfig(**options)) as processor:
+            if from_files:
+                results = processor.process_file(TEST_DATA / "sample_data.json", TEST_DATA / "metadata_src.csv", output_dir)
+            else:
+                results = processor.process_data(sample_input_data, sample_mapping_data, output_dir)
+        outputs = {}
+        for path in output_dir.glob("*_metadata.yaml"):
+            data = yaml.safe_load(path.read_text(encoding="utf-8"))
+            data["metadata"].pop("created_at", None)
+            outputs[path.name] = data
+        return results, output_dir, outputs
+    return run
+
+def test_process_data_json_output(run_processor):
+    """Test output_format json ghi file .json cho entity và summary"""
+    _, output_dir, _ = run_processor(output_format="json")
+    
+    hub_file = output_dir / "hub_customer_metadata.json"
+    assert hub_file.exists()
+    assert json.loads(hub_file.read_text(encoding="utf-8"))["target_entity_type"] == "hub"
+    assert (output_dir / "processing_hub_summary.json").exists()
+    assert not list(output_dir.glob("*.yaml"))
+
+def test_process_data_parse_workers_same_output(run_processor):
+    """Test parse_workers > 0 cho ra cùng file với parse trong process hiện tại"""
+    _, _, serial = run_processor("serial")
+    _, _, workers = run_processor("workers", parse_workers=2)
+    
+    assert serial
+    assert workers == serial
+
+def test_process_data_processing_summary(run_processor):
+    """Test summary ghi số lượng entity theo status"""
+    results, output_dir, _ = run_processor()
+    
+    summary = yaml.safe_load((output_dir / "processing_hub_summary.yaml").read_text(encoding="utf-8"))
+    counts = summary["processing_summary"]
+    statuses = [r["status"] for r in results["hubs"]]
+    assert counts["total_hubs"] == len(statuses)
+    assert counts["errors"] == statuses.count("error")
+    assert counts["successful"] == len(statuses) - statuses.count("error")
+
+def test_process_data_skip_unchanged(run_processor):
+    """Test skip_unchanged_writes giữ nguyên file có nội dung giống hệt, chỉ ghi file thay đổi"""
+    _, output_dir, _ = run_processor(skip_unchanged_writes=True)
+    hub_file = output_dir / "hub_customer_metadata.yaml"
+    document = yaml.safe_load(hub_file.read_text(encoding="utf-8"))
+    os.utime(hub_file, ns=(0, 0))
+    
+    with DataProcessor(ParserConfig(skip_unchanged_writes=True)) as processor:
+        processor.file_processor._save_yaml(document, hub_file)
+        assert hub_file.stat().st_mtime_ns == 0
+        processor.file_processor._save_yaml(dict(document, description="changed"), hub_file)
+    assert "changed" in hub_file.read_text(encoding="utf-8")
+
+def test_process_data_combined_output(run_processor):
+    """Test combined_output ghi tất cả hub vào một file YAML nhiều document"""
+    results, output_dir, outputs = run_processor(combined_output=True)
+    
+    documents = list(yaml.safe_load_all((output_dir / "hubs.yaml").read_text(encoding="utf-8")))
+    assert [doc["target_table"] for doc in documents] == [
+        r["hub"].upper() for r in results["hubs"] if r["status"] != "error"
+    ]
+    assert not outputs
+
+def test_process_file_categorical_mapping_same_output(run_processor):
+    """Test mapping_dtypes kiểu category cho ra cùng file với kiểu str"""
+    categorical = {col: "category" for col in ("SCHEMA_NAME", "TABLE_NAME", "COLUMN_NAME", "DATA_TYPE")}
+    _, _, text = run_processor("str", from_files=True)
+    _, _, category = run_processor("category", from_files=True, mapping_dtypes=categorical)
+    
+    assert text
+    assert category == text
+
+def test_read_mapping_csv_pyarrow_engine_matches_c(monkeypatch, run_processor):
+    """Test engine pyarrow (tự chọn khi có pyarrow) đọc mapping giống engine c"""
+    pytest.importorskip("pyarrow")
+    from datavault_assistant.core.nodes import data_vault_parser
+    
+    frames, outputs = {}, {}
+    for engine in ("c", "pyarrow"):
+        monkeypatch.setattr(data_vault_parser, "MAPPING_CSV_ENGINE", engine)
+        frames[engine] = DataProcessor(ParserConfig())._read_mapping_csv(TEST_DATA / "metadata_src.csv")
+        _, _, outputs[engine] = run_processor(engine, from_files=True)
+    
+    pd.testing.assert_frame_equal(frames["pyarrow"], frames["c"])
+    assert outputs["c"]
+    assert outputs["pyarrow"] == outputs["c"]
@@ -0,0 +1,191 @@
+import json
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from datavault_assistant.core.nodes.data_vault_builder import (
+    DataVaultAnalyzer,
+    _extract_json_block,
+    _merge_analyses,
+    _stream_json_block,
+    split_metadata
+)
+
+class FakeStreamChain:
+    """Chain giả stream response theo từng chunk và đếm số chunk đã đọc"""
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.consumed = 0
+
+    def stream(self, inputs):
+        for chunk in self.chunks:
+            self.consumed += 1
+            yield SimpleNamespace(content=chunk)
+
+@pytest.mark.parametrize("chunks", [
+    ["Query:\n```sql\nSELECT * FROM T\n```\n", "```json\n{\"hubs\": []}\n```", "\ntrailing"],
+    ["```sq", "l\nSELECT 1\n``", "`\n``", "`js", "on\n{\"hubs\"", ": []}\n`", "``"],
+])
+def test_stream_json_block_prefers_json_fence(chunks):
+    """Test stream chọn block ```json giống _extract_json_block dù có block ngôn ngữ khác trước"""
+    chain = FakeStreamChain(chunks)
+    assert _stream_json_block(chain, {}) == '{"hubs": []}'
+    assert _extract_json_block("".join(chunks)) == '{"hubs": []}'
+
+def test_stream_json_block_stops_after_json_fence_closes():
+    """Test dừng đọc stream ngay khi block ```json đóng"""
+    chain = FakeStreamChain(["```json\n{}", "\n```", "\nmore", " text"])
+    assert _stream_json_block(chain, {}) == "{}"
+    assert chain.consumed == 2
+
+def test_stream_json_block_plain_fence_only_at_end():
+    """Test chỉ dùng block ``` thường khi cả response không có ```json"""
+    chunks = ["```\n{\"a\": 1}\n```", "\nno json fence here"]
+    chain = FakeStreamChain(chunks)
+    assert _stream_json_block(chain, {}) == '{"a": 1}'
+    assert chain.consumed == len(chunks)
+
+def test_stream_json_block_without_fence_raises():
+    """Test response không có block nào báo lỗi"""
+    with pytest.raises(ValueError):
+        _stream_json_block(FakeStreamChain(["no fence"]), {})
+
+def _metadata(tables: int) -> str:
+    rows = ["SCHEMA_NAME\tTABLE_NAME\tCOLUMN_NAME"]
+    for t in range(tables):
+        rows += [f"S\tT{t}\tID", f"S\tT{t}\tNAME"]
+    return "\n".join(rows)
+
+def test_split_metadata_groups_tables_with_header():
+    """Test split_metadata chia theo nhóm bảng, mỗi chunk giữ header và đủ cột của bảng"""
+    metadata = _metadata(5)
+    chunks = split_metadata(metadata, chunk_tables=2)
+    assert len(chunks) == 3
+    for chunk in chunks:
+        assert chunk.split("\n")[0] == "SCHEMA_NAME\tTABLE_NAME\tCOLUMN_NAME"
+    assert [line for chunk in chunks for line in chunk.split("\n")[1:]] == metadata.split("\n")[1:]
+    assert chunks[0].split("\n")[1:] == ["S\tT0\tID", "S\tT0\tNAME", "S\tT1\tID", "S\tT1\tNAME"]
+
+def test_split_metadata_keeps_small_or_unknown_input():
+    """Test input ít bảng hoặc không có cột TABLE_NAME giữ nguyên một chunk"""
+    assert split_metadata(_metadata(2), chunk_tables=2) == [_metadata(2)]
+    assert split_metadata("A\tB\n1\t2", chunk_tables=1) == ["A\tB\n1\t2"]
+
+def test_merge_analyses_unions_entities_by_name():
+    """Test _merge_analyses gộp entity cùng tên và hợp các list field"""
+    merged = _merge_analyses([
+        {"hubs": [{"name": "HUB_A", "source_tables": ["T0"], "description": "a"}], "note": "first"},
+        {"hubs": [{"name": "HUB_A", "source_tables": ["T0", "T1"], "description": "other"},
+                  {"name": "HUB_B", "source_tables": ["T2"]}], "note": "second"},
+    ])
+    assert merged == {
+        "hubs": [
+            {"name": "HUB_A", "source_tables": ["T0", "T1"], "description": "a"},
+            {"name": "HUB_B", "source_tables": ["T2"]},
+        ],
+        "note": "first",
+    }
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    from langchain_core.language_models.fake_chat_models import FakeListChatModel
+    from datavault_assistant.core.utils import cache_handler
+    monkeypatch.setattr(cache_handler.settings, "LLM_CACHE_ENABLED", False)
+    return FakeListChatModel(responses=["```json\n{}\n```"])
+
+def test_analyze_does_not_chunk_by_default(fake_llm):
+    """Test mặc định analyze gửi toàn bộ metadata trong một lần gọi"""
+    analyzer = DataVaultAnalyzer(fake_llm)
+    metadata = _metadata(20)
+    with patch.object(analyzer.hub_analyzer, "analyze", return_value='{"hubs": []}') as hub, \
+         patch.object(analyzer.sat_analyzer, "analyze", return_value='{"satellites": []}') as sat:
+        assert analyzer.analyze(metadata) == {"hubs": [], "satellites": []}
+    hub.assert_called_once_with(metadata)
+    sat.assert_called_once()
+
+def test_analyze_chunks_when_chunk_tables_set(fake_llm):
+    """Test chunk_tables bật phân tích theo nhóm bảng rồi gộp kết quả"""
+    analyzer = DataVaultAnalyzer(fake_llm, chunk_tables=8)
+
+    async def hub_analysis(chunk):
+        return '{"hubs": [{"name": "HUB_%d", "source_tables": []}]}' % chunk.count("\n")
+
+    with patch.object(analyzer.hub_analyzer, "aanalyze", side_effect=hub_analysis) as hub, \
+         patch.object(analyzer.sat_analyzer, "aanalyze", AsyncMock(return_value='{"satellites": []}')):
+        result = analyzer.analyze(_metadata(20))
+    assert hub.call_count == 3
+    assert [h["name"] for h in result["hubs"]] == ["HUB_16", "HUB_8"]
+
+class FakeLLM:
+    """LLM giả: trả JSON theo metadata của prompt, 'BAD' làm call lỗi, đếm số lần gọi"""
+    def __init__(self):
+        from langchain_core.runnables import RunnableLambda
+        self.calls = []
+        self.runnable = RunnableLambda(self._respond)
+
+    def _respond(self, prompt_value):
+        from langchain_core.messages import AIMessage
+        text = prompt_value.to_string()
+        metadata = text.split("Table Metadata: ")[1].split("\n")[0]
+        is_sat = "HUB and LINK Analysis" in text
+        self.calls.append(("sat" if is_sat else "hub", metadata))
+        if metadata == "BAD":
+            raise RuntimeError("LLM failed")
+        body = {"satellites": [{"name": f"SAT_{metadata}"}]} if is_sat else {"hubs": [{"name": f"HUB_{metadata}"}]}
+        return AIMessage(content="```json\n" + json.dumps(body) + "\n```")
+
+@pytest.fixture
+def batch_llm(tmp_path, monkeypatch):
+    from datavault_assistant.core.utils import cache_handler
+    cache = cache_handler.LLMResponseCache(tmp_path)
+    monkeypatch.setattr(cache_handler.settings, "LLM_CACHE_ENABLED", True)
+    monkeypatch.setattr(cache_handler, "get_llm_cache", lambda: cache)
+    return FakeLLM()
+
+def _expected(metadata):
+    return {"hubs": [{"name": f"HUB_{metadata}"}], "satellites": [{"name": f"SAT_{metadata}"}]}
+
+def test_analyze_many_results_in_order_with_failures(batch_llm):
+    """Test analyze_many trả kết quả theo thứ tự input, None và warning cho payload lỗi"""
+    analyzer = DataVaultAnalyzer(batch_llm.runnable)
+    results = analyzer.analyze_many(["A", "BAD", "B"])
+    assert results == [_expected("A"), None, _expected("B")]
+    assert len(analyzer.warnings) == 1 and "2/3" in analyzer.warnings[0]
+    # Payload lỗi ở bước hub không gọi bước satellite
+    assert sorted(batch_llm.calls) == [("hub", "A"), ("hub", "B"), ("hub", "BAD"), ("sat", "A"), ("sat", "B")]
+
+def test_analyze_many_shares_cache_with_analyze(batch_llm):
+    """Test analyze_many dùng chung cache với analyze, lần sau không gọi lại LLM cho payload đã có"""
+    analyzer = DataVaultAnalyzer(batch_llm.runnable)
+    analyzer.analyze_many(["A"])
+    calls = len(batch_llm.calls)
+    assert analyzer.analyze("A") == _expected("A")
+    assert analyzer.analyze_many(["A", "C"]) == [_expected("A"), _expected("C")]
+    assert batch_llm.calls[calls:] == [("hub", "C"), ("sat", "C")]
+
+def test_aanalyze_many_method_and_function_match(batch_llm):
+    """Test aanalyze_many của module là shortcut của DataVaultAnalyzer.aanalyze_many"""
+    import asyncio
+    from datavault_assistant.core.nodes.data_vault_builder import aanalyze_many
+    method = asyncio.run(DataVaultAnalyzer(batch_llm.runnable).aanalyze_many(["A", "BAD"]))
+    function = asyncio.run(aanalyze_many(["A", "BAD"], batch_llm.runnable))
+    assert method == function == [_expected("A"), None]
+
+def test_aanalyze_many_does_cache_io_off_event_loop(batch_llm, monkeypatch):
+    """Test aanalyze_many đọc/ghi cache trong worker thread, không chặn event loop"""
+    import asyncio
+    import threading
+    from datavault_assistant.core.utils import cache_handler
+    cache = cache_handler.get_llm_cache()
+    threads = []
+    for name in ("get", "set"):
+        method = getattr(cache, name)
+        def spy(*args, _method=method):
+            threads.append(threading.get_ident())
+            return _method(*args)
+        monkeypatch.setattr(cache, name, spy)
+    async def run():
+        await DataVaultAnalyzer(batch_llm.runnable).aanalyze_many(["A"])
+        return threading.get_ident()
+    loop_thread = asyncio.run(run())
+    assert threads and loop_thread not in threads
+
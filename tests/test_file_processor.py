@@ -33,4 +33,60 @@ def test_process_file_success(data_processor, tmp_path):
         # Kiểm tra kết quả
         assert "hubs" in result
         assert len(result["hubs"]) == 1
-        assert result["hubs"][0]["status"] == "success"
\ No newline at end of file
+        assert result["hubs"][0]["status"] == "success"
+
+def test_save_yaml_fast_emit_matches_pyyaml(tmp_path):
+    """Test fast emitter cho hub/link cho ra cùng nội dung với yaml.dump"""
+    import yaml
+    from datavault_assistant.core.nodes.data_vault_parser import FileProcessor
+    
+    data = {
+        "source_schema": "FLEXLIVE",
+        "target_entity_type": "lnk",
+        "description": 'Liên kết "khách hàng": địa chỉ\nnull',
+        "metadata": {"version": "1.0.0", "validation_warnings": None},
+        "columns": [
+            {"target": "DV_HKEY_LNK", "dtype": "raw", "source": ["CUSTOMER_NO", "123"]},
+            {"target": "DV_HKEY_HUB", "parent": "HUB", "source": [{"name": "CUSTOMER_NO", "dtype": "VARCHAR2(20)"}]},
+            {"target": "EMPTY", "source": []}
+        ]
+    }
+    fast_file = tmp_path / "fast.yaml"
+    slow_file = tmp_path / "slow.yaml"
+    FileProcessor(fast_emit=True)._save_yaml(data, fast_file)
+    FileProcessor()._save_yaml(data, slow_file)
+    
+    assert yaml.safe_load(fast_file.read_text(encoding="utf-8")) == data
+    assert yaml.safe_load(slow_file.read_text(encoding="utf-8")) == data
+
+@pytest.mark.parametrize("text", ["DEL\x7fchar", "NEL\x85line", "LS \u2028 PS \u2029 end", "BOM\ufeff", "tab\tnul\x00 \U0001F600"])
+def test_save_yaml_fast_emit_round_trips_special_characters(tmp_path, text):
+    """Test fast emitter giữ nguyên ký tự đặc biệt, fallback về PyYAML khi YAML không đọc lại được"""
+    import yaml
+    from datavault_assistant.core.nodes.data_vault_parser import FileProcessor
+    
+    data = {
+        "target_entity_type": "sat",
+        "description": text,
+        "columns": [{"target": "ATTR", "source": {"name": text, "dtype": "VARCHAR2(10)"}}],
+        "metadata": {text: text}
+    }
+    output_file = tmp_path / "sat.yaml"
+    FileProcessor(fast_emit=True)._save_yaml(data, output_file)
+    
+    assert yaml.safe_load(output_file.read_text(encoding="utf-8")) == data
+
+@pytest.mark.parametrize("value", [1e-05, 1e+16, 1e+300, -1e-300, 5e-324, 1.5e+20, 0.1, float("inf"), float("-inf")])
+def test_save_yaml_fast_emit_round_trips_floats(tmp_path, value):
+    """Test fast emitter ghi float có số mũ để YAML đọc lại đúng kiểu float"""
+    import yaml
+    from datavault_assistant.core.nodes.data_vault_parser import FileProcessor
+    
+    data = {"target_entity_type": "hub", "metadata": {"value": value}, "columns": [{"target": "ID", "scale": value}]}
+    output_file = tmp_path / "hub.yaml"
+    FileProcessor(fast_emit=True)._save_yaml(data, output_file)
+    
+    loaded = yaml.safe_load(output_file.read_text(encoding="utf-8"))
+    assert loaded == data
+    assert isinstance(loaded["metadata"]["value"], float)
+